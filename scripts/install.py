@@ -14,6 +14,7 @@ Usage:
     python install.py --skip-global    # install tools only
     python install.py --version 0.4.5  # pin to a specific version
     python install.py --upgrade        # upgrade existing installations
+    python install.py --jobs 1         # serial pipx installs
     python install.py --uninstall      # reverse everything
     python install.py --dry-run        # preview actions
 
@@ -23,11 +24,15 @@ Author: Olivier Vitrac, PhD, HDR | olivier.vitrac@adservio.fr | Adservio
 from __future__ import annotations
 
 import argparse
+import functools
+import json
 import os
 import platform
 import shutil
 import subprocess
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -40,6 +45,10 @@ TOOLBOX_SPEC = "adservio-toolbox"
 MEMCTL_SPEC = "memctl[mcp,docs]"
 CLOAKMCP_SPEC = "cloakmcp"
 MIN_PYTHON = (3, 10)
+RELEASE_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "adservio-toolbox" / "releases"
+)
 TOTAL_STEPS = 7
 
 IS_WINDOWS = sys.platform == "win32"
@@ -48,42 +57,63 @@ IS_WINDOWS = sys.platform == "win32"
 # ANSI helpers (TTY-aware)
 # ---------------------------------------------------------------------------
 
-_use_color = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
-if IS_WINDOWS:
-    # Enable ANSI on Windows 10+ if possible
-    try:
-        import ctypes
-        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-        kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
-    except Exception:
-        _use_color = False
 
-_B = "\033[1m" if _use_color else ""
-_R = "\033[0m" if _use_color else ""
-_GREEN = "\033[32m" if _use_color else ""
-_YELLOW = "\033[33m" if _use_color else ""
-_RED = "\033[31m" if _use_color else ""
-_CYAN = "\033[36m" if _use_color else ""
+@functools.lru_cache(maxsize=None)
+def _palette() -> dict[str, str]:
+    """Return SGR codes and message prefixes, decided on first print.
+
+    Deferred so importing this script stays cheap: the TTY check and, on
+    Windows, the ``ctypes`` console-mode call only run when output begins.
+    """
+    use_color = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+    if IS_WINDOWS and use_color:
+        # Enable ANSI on Windows 10+ if possible
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+            kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+        except Exception:
+            use_color = False
+
+    b, r, green, yellow, red, cyan = (
+        ("\033[1m", "\033[0m", "\033[32m", "\033[33m", "\033[31m", "\033[36m")
+        if use_color else ("",) * 6
+    )
+    return {
+        "bold": b,
+        "reset": r,
+        "step": f"{b}{cyan}[STEP ",
+        "ok": f"{green}[OK]{r}    ",
+        "info": f"{cyan}[INFO]{r}  ",
+        "warn": f"{yellow}[WARN]{r}  ",
+        "err": f"{red}[ERROR]{r} ",
+    }
+
+
+def _bold(text: str) -> str:
+    pal = _palette()
+    return pal["bold"] + text + pal["reset"]
 
 
 def step(n: int, msg: str) -> None:
-    print(f"{_B}{_CYAN}[STEP {n}/{TOTAL_STEPS}]{_R} {msg}")
+    pal = _palette()
+    print(f"{pal['step']}{n}/{TOTAL_STEPS}]{pal['reset']} {msg}")
 
 
 def ok(msg: str) -> None:
-    print(f"{_GREEN}[OK]{_R}    {msg}")
+    print(_palette()["ok"] + msg)
 
 
 def info(msg: str) -> None:
-    print(f"{_CYAN}[INFO]{_R}  {msg}")
+    print(_palette()["info"] + msg)
 
 
 def warn(msg: str) -> None:
-    print(f"{_YELLOW}[WARN]{_R}  {msg}")
+    print(_palette()["warn"] + msg)
 
 
 def err(msg: str) -> None:
-    print(f"{_RED}[ERROR]{_R} {msg}", file=sys.stderr)
+    print(_palette()["err"] + msg, file=sys.stderr)
 
 
 # ---------------------------------------------------------------------------
@@ -92,6 +122,13 @@ def err(msg: str) -> None:
 
 DRY_RUN = False
 
+# Windows: skip handle enumeration for redirected child stdio (slow on
+# older CPython builds); POSIX keeps the default close_fds=True.  Short
+# captured probes only: streamed jobs run from several threads at once and
+# must not inherit each other's pipe handles (a reader would wait for EOF).
+_POPEN_KWARGS: dict = {"close_fds": False} if IS_WINDOWS else {}
+PROBE_TIMEOUT = 10
+
 
 def run_cmd(
     cmd: list[str],
@@ -99,20 +136,64 @@ def run_cmd(
     check: bool = True,
     capture: bool = False,
     quiet: bool = False,
+    prefix: str = "",
+    timeout: float | None = None,
 ) -> subprocess.CompletedProcess[str]:
-    """Execute a command, respecting dry-run mode."""
+    """Execute a command, respecting dry-run mode.
+
+    Uncaptured output goes straight to the inherited stdout/stderr (the
+    child keeps its colours), unless a *prefix* is given: then it is piped
+    and streamed line by line, each line tagged (used for parallel jobs).
+    *timeout* applies to captured calls; an expired probe reports exit
+    code 124.
+    """
     if DRY_RUN and not capture:
         info(f"[dry-run] {' '.join(cmd)}")
         return subprocess.CompletedProcess(cmd, 0, "", "")
-    kwargs: dict = {"text": True}
-    if capture or quiet:
-        kwargs["capture_output"] = True
     try:
-        return subprocess.run(cmd, check=check, **kwargs)
+        if capture or quiet:
+            return subprocess.run(
+                cmd, check=check, text=True, capture_output=True,
+                timeout=timeout, **_POPEN_KWARGS,
+            )
+        if not prefix:
+            return subprocess.run(cmd, check=check, text=True)
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1,
+        )
     except FileNotFoundError:
         if check:
             raise
         return subprocess.CompletedProcess(cmd, 127, "", f"{cmd[0]}: not found")
+    except subprocess.TimeoutExpired:
+        if check:
+            raise
+        return subprocess.CompletedProcess(cmd, 124, "", f"{cmd[0]}: timed out")
+    assert proc.stdout is not None
+    with proc.stdout:
+        for line in proc.stdout:
+            sys.stdout.write(prefix + line)
+            sys.stdout.flush()
+    returncode = proc.wait()
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    return subprocess.CompletedProcess(cmd, returncode, "", "")
+
+
+# ---------------------------------------------------------------------------
+# PATH lookup
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """Cached ``shutil.which``: PATH does not change during one run.
+
+    Installs add new commands, so the installers call ``_which.cache_clear()``
+    after mutating the environment.
+    """
+    return shutil.which(name)
 
 
 # ---------------------------------------------------------------------------
@@ -120,11 +201,51 @@ def run_cmd(
 # ---------------------------------------------------------------------------
 
 
-def find_python() -> tuple[str, str] | None:
+_PYTHON_PROBE = (
+    "import importlib.util, json, sys, sysconfig; from pathlib import Path; "
+    "print(json.dumps({"
+    "'ver': '%d.%d' % sys.version_info[:2], "
+    "'pip': importlib.util.find_spec('pip') is not None, "
+    "'venv': importlib.util.find_spec('venv') is not None, "
+    "'pep668': Path(sysconfig.get_path('stdlib'), 'EXTERNALLY-MANAGED').exists()"
+    "}))"
+)
+
+
+def _self_caps() -> dict[str, bool]:
+    """Capabilities of the running interpreter, probed in-process."""
+    import importlib.util
+    import sysconfig
+
+    return {
+        "pip": importlib.util.find_spec("pip") is not None,
+        "venv": importlib.util.find_spec("venv") is not None,
+        "pep668": Path(sysconfig.get_path("stdlib"), "EXTERNALLY-MANAGED").exists(),
+    }
+
+
+def find_python() -> tuple[tuple[str, ...], str, dict[str, bool]] | None:
     """Find a compliant Python interpreter.
 
-    Returns (python_cmd, version_string) or None.
+    A single ``python -c`` launch per candidate reports both the version and
+    the capabilities (pip, venv, PEP 668) of the interpreter.  The
+    ``find_spec`` checks never import pip itself.
+
+    When the interpreter running this script is compliant (and not a venv,
+    where ``pip install --user`` is refused), it is used directly and no
+    subprocess is spawned at all.
+
+    Returns (python_cmd, version_string, caps) or None, where python_cmd is
+    the pre-split argv prefix, e.g. ``("py", "-3")`` or ``("python3",)``.
     """
+    if (
+        sys.version_info[:2] >= MIN_PYTHON
+        and sys.executable
+        and sys.prefix == sys.base_prefix
+    ):
+        ver = f"{sys.version_info.major}.{sys.version_info.minor}"
+        return ((sys.executable,), ver, _self_caps())
+
     candidates = []
     if IS_WINDOWS:
         # py launcher first (standard Windows Python discovery)
@@ -133,7 +254,7 @@ def find_python() -> tuple[str, str] | None:
         candidates.extend(["python3", "python"])
 
     for candidate in candidates:
-        path = shutil.which(candidate)
+        path = _which(candidate)
         if not path:
             continue
         cmd = [candidate]
@@ -141,16 +262,17 @@ def find_python() -> tuple[str, str] | None:
             cmd.append("-3")
         try:
             result = subprocess.run(
-                [*cmd, "-c",
-                 "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}')"],
-                capture_output=True, text=True, timeout=10,
+                [*cmd, "-c", _PYTHON_PROBE],
+                capture_output=True, text=True, timeout=PROBE_TIMEOUT,
+                **_POPEN_KWARGS,
             )
             if result.returncode != 0:
                 continue
-            ver = result.stdout.strip()
+            probe = json.loads(result.stdout)
+            ver = probe.pop("ver")
             major, minor = (int(x) for x in ver.split("."))
             if (major, minor) >= MIN_PYTHON:
-                return (" ".join(cmd), ver)
+                return (tuple(cmd), ver, probe)
         except Exception:
             continue
     return None
@@ -161,34 +283,13 @@ def find_python() -> tuple[str, str] | None:
 # ---------------------------------------------------------------------------
 
 
-def probe_pip(python_cmd: str) -> bool:
-    """Check if pip module is available."""
-    args = python_cmd.split() + ["-m", "pip", "--version"]
-    result = run_cmd(args, check=False, capture=True)
-    return result.returncode == 0
-
-
-def probe_venv(python_cmd: str) -> bool:
-    """Check if venv module is available."""
-    args = python_cmd.split() + ["-c", "import venv"]
-    result = run_cmd(args, check=False, capture=True)
-    return result.returncode == 0
-
-
-def probe_pep668(python_cmd: str) -> bool:
-    """Detect PEP 668 externally-managed Python."""
-    args = python_cmd.split() + [
-        "-c",
-        "import sysconfig; from pathlib import Path; "
-        "print(Path(sysconfig.get_path('stdlib'), 'EXTERNALLY-MANAGED').exists())",
-    ]
-    result = run_cmd(args, check=False, capture=True)
-    return result.stdout.strip() == "True"
-
-
+@functools.lru_cache(maxsize=None)
 def find_pipx() -> str | None:
-    """Find pipx on PATH. Returns the command string or None."""
-    if shutil.which("pipx"):
+    """Find pipx on PATH. Returns the command string or None.
+
+    Cached for the run; ``ensure_pipx`` clears the cache after a bootstrap.
+    """
+    if _which("pipx"):
         return "pipx"
     # Check common user install location
     local_pipx = Path.home() / ".local" / "bin" / "pipx"
@@ -206,9 +307,10 @@ def find_pipx() -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def find_uv() -> str | None:
-    """Find uv on PATH."""
-    path = shutil.which("uv")
+    """Find uv on PATH (cached for the run)."""
+    path = _which("uv")
     return path if path else None
 
 
@@ -217,7 +319,9 @@ def probe_pipx_health(pipx_cmd: str = "pipx") -> bool:
 
     Guards against stale shims, broken venvs, or removed Python interpreters.
     """
-    result = run_cmd([pipx_cmd, "--version"], check=False, capture=True)
+    result = run_cmd(
+        [pipx_cmd, "--version"], check=False, capture=True, timeout=PROBE_TIMEOUT,
+    )
     return result.returncode == 0
 
 
@@ -226,30 +330,43 @@ def probe_pipx_health(pipx_cmd: str = "pipx") -> bool:
 # ---------------------------------------------------------------------------
 
 
+def _os_release_id() -> str:
+    """Return the ``ID`` field of os-release, or "" when unavailable."""
+    try:
+        return platform.freedesktop_os_release().get("ID", "")
+    except AttributeError:
+        # Python < 3.10: the hints must still work on the old interpreter
+        # that is running this script.
+        try:
+            with open("/etc/os-release") as f:
+                for line in f:
+                    if line.startswith("ID="):
+                        return line.split("=", 1)[1].strip().strip('"')
+        except OSError:
+            pass
+    except OSError:
+        pass
+    return ""
+
+
+@functools.lru_cache(maxsize=None)
 def detect_platform() -> str:
-    """Detect platform for actionable error messages."""
+    """Detect platform for actionable error messages (cached per run)."""
     if IS_WINDOWS:
         return "windows"
     if sys.platform == "darwin":
         return "macos"
-    try:
-        with open("/etc/os-release") as f:
-            content = f.read()
-        for line in content.splitlines():
-            if line.startswith("ID="):
-                distro_id = line.split("=", 1)[1].strip().strip('"')
-                if distro_id in ("ubuntu", "debian", "linuxmint", "pop"):
-                    return "debian"
-                if distro_id in ("rhel", "centos", "fedora", "rocky", "alma"):
-                    return "rhel"
-                if distro_id == "alpine":
-                    return "alpine"
-                if distro_id in ("arch", "manjaro"):
-                    return "arch"
-                if distro_id.startswith("opensuse") or distro_id == "sles":
-                    return "suse"
-    except FileNotFoundError:
-        pass
+    distro_id = _os_release_id()
+    if distro_id in ("ubuntu", "debian", "linuxmint", "pop"):
+        return "debian"
+    if distro_id in ("rhel", "centos", "fedora", "rocky", "alma"):
+        return "rhel"
+    if distro_id == "alpine":
+        return "alpine"
+    if distro_id in ("arch", "manjaro"):
+        return "arch"
+    if distro_id.startswith("opensuse") or distro_id == "sles":
+        return "suse"
     return "unknown"
 
 
@@ -299,7 +416,7 @@ def print_pipx_hint() -> None:
 # ---------------------------------------------------------------------------
 
 
-def ensure_pipx(python_cmd: str, is_pep668: bool) -> str | None:
+def ensure_pipx(python_cmd: tuple[str, ...], is_pep668: bool) -> str | None:
     """Ensure pipx is available and functional. Returns pipx command or None.
 
     Called only when the initial pipx health check failed.
@@ -319,7 +436,7 @@ def ensure_pipx(python_cmd: str, is_pep668: bool) -> str | None:
         return None
 
     info("Bootstrapping pipx via pip ...")
-    args = python_cmd.split() + ["-m", "pip", "install", "--user", "pipx"]
+    args = [*python_cmd, "-m", "pip", "install", "--user", "pipx"]
     result = run_cmd(args, check=False)
     if result.returncode != 0:
         warn("Could not bootstrap pipx via pip.")
@@ -327,6 +444,8 @@ def ensure_pipx(python_cmd: str, is_pep668: bool) -> str | None:
 
     # Try ensurepath
     run_cmd(["pipx", "ensurepath"], check=False, quiet=True)
+    _which.cache_clear()
+    find_pipx.cache_clear()
 
     # Re-check with functional probe
     found = find_pipx()
@@ -339,50 +458,154 @@ def ensure_pipx(python_cmd: str, is_pep668: bool) -> str | None:
     return None
 
 
-def pipx_install(
+@functools.lru_cache(maxsize=1)
+def _pipx_list_short(pipx_cmd: str) -> frozenset[str]:
+    """Return the names of pipx-installed packages (one pipx call per run).
+
+    Callers that mutate the pipx state must call ``cache_clear()``.
+    """
+    result = run_cmd([pipx_cmd, "list", "--short"], check=False, capture=True)
+    return frozenset(
+        line.split()[0] for line in result.stdout.splitlines() if line.strip()
+    )
+
+
+def _pipx_argv(
     pipx_cmd: str,
     spec: str,
     display_name: str,
     *,
     version: str = "",
     upgrade: bool = False,
-    source: str = "",
-) -> None:
-    """Install a package via pipx."""
-    # Check if already installed
-    result = run_cmd(
-        [pipx_cmd, "list", "--short"], check=False, capture=True,
-    )
-    installed = any(
-        line.startswith(f"{display_name} ")
-        for line in result.stdout.splitlines()
-    )
+    source: str | Callable[[], str] = "",
+) -> list[str] | None:
+    """Return the pipx command for one package, or None if nothing to do.
+
+    *source* may be a zero-argument resolver: it is called only when the
+    command is an install that uses it (not for upgrades or no-ops).
+    """
+    installed = display_name in _pipx_list_short(pipx_cmd)
 
     if upgrade and installed:
-        info(f"Upgrading {display_name} ...")
-        run_cmd([pipx_cmd, "upgrade", display_name])
-        ok(f"{display_name} upgraded")
-        return
+        return [pipx_cmd, "upgrade", display_name]
 
     if installed and not upgrade:
-        ok(f"{display_name} already installed (use --upgrade to force)")
-        return
+        return None
+
+    if callable(source):
+        source = source()
 
     install_target = source if source else spec
     if version and not source:
         install_target = f"{spec}=={version}"
 
-    info(f"Installing {display_name} ...")
     cmd = [pipx_cmd, "install"]
     if source and installed:
         cmd.append("--force")
     cmd.append(install_target)
+    return cmd
+
+
+def pipx_install(
+    pipx_cmd: str,
+    spec: str,
+    display_name: str,
+    *,
+    version: str = "",
+    upgrade: bool = False,
+    source: str | Callable[[], str] = "",
+) -> None:
+    """Install a package via pipx (*source* as in :func:`_pipx_argv`)."""
+    cmd = _pipx_argv(
+        pipx_cmd, spec, display_name,
+        version=version, upgrade=upgrade, source=source,
+    )
+    if cmd is None:
+        ok(f"{display_name} already installed (use --upgrade to force)")
+        return
+
+    if cmd[1] == "upgrade":
+        info(f"Upgrading {display_name} ...")
+        run_cmd(cmd)
+        _pipx_list_short.cache_clear()
+        ok(f"{display_name} upgraded")
+        return
+
+    info(f"Installing {display_name} ...")
     run_cmd(cmd)
+    _pipx_list_short.cache_clear()
+    _which.cache_clear()
     ok(f"{display_name} installed")
 
 
+def pipx_install_many(
+    pipx_cmd: str,
+    jobs: list[dict[str, str | Callable[[], str]]],
+    *,
+    version: str = "",
+    upgrade: bool = False,
+    max_workers: int = 3,
+) -> None:
+    """Install several packages via pipx concurrently (Track A).
+
+    Each job is a dict with ``spec``, ``display`` and optional ``source``
+    (a path/URL or a lazy resolver, see :func:`_pipx_argv`).
+    Every pipx install builds its own venv, but all of them create and
+    pip-upgrade pipx's shared-libraries venv: the first job runs alone so
+    that venv exists, the rest then run in parallel.  Output is streamed
+    live, each line prefixed with the job's name.  Exits on the first
+    reported failure once all jobs have completed.
+    """
+    pending: dict[str, list[str]] = {}
+    for job in jobs:
+        display = job["display"]
+        cmd = _pipx_argv(
+            pipx_cmd, job["spec"], display,
+            version=version, upgrade=upgrade, source=job.get("source", ""),
+        )
+        if cmd is None:
+            ok(f"{display} already installed (use --upgrade to force)")
+        else:
+            pending[display] = cmd
+
+    if not pending:
+        return
+
+    failed: list[str] = []
+
+    def _report(display: str, returncode: int) -> None:
+        verb = "upgraded" if pending[display][1] == "upgrade" else "installed"
+        if returncode == 0:
+            ok(f"{display} {verb}")
+        else:
+            err(f"{display}: pipx exited with code {returncode}")
+            failed.append(display)
+
+    first, *rest = pending
+    info(f"Running pipx job for {first} (sets up pipx shared libraries)")
+    _report(first, run_cmd(pending[first], check=False, prefix=f"  [{first}] ").returncode)
+
+    if rest:
+        info(f"Running {len(rest)} pipx job(s) in parallel: {', '.join(rest)}")
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                pool.submit(
+                    run_cmd, pending[display], check=False, prefix=f"  [{display}] ",
+                ): display
+                for display in rest
+            }
+            for future in as_completed(futures):
+                _report(futures[future], future.result().returncode)
+
+    _pipx_list_short.cache_clear()
+    _which.cache_clear()
+    if failed:
+        err(f"pipx failed for: {', '.join(failed)}")
+        sys.exit(1)
+
+
 def pip_install(
-    python_cmd: str,
+    python_cmd: tuple[str, ...],
     spec: str,
     display_name: str,
     *,
@@ -395,16 +618,50 @@ def pip_install(
     if version and not source:
         install_target = f"{spec}=={version}"
 
-    cmd = python_cmd.split() + ["-m", "pip", "install", "--user"]
+    cmd = [*python_cmd, "-m", "pip", "install", "--user"]
     if upgrade:
         cmd.append("--upgrade")
     cmd.append(install_target)
 
     info(f"Installing {display_name} via pip --user (fallback) ...")
     run_cmd(cmd)
+    _which.cache_clear()
     ok(f"{display_name} installed (pip --user)")
 
 
+def pip_install_batch(
+    python_cmd: tuple[str, ...],
+    jobs: list[tuple[str, str, str]],
+    *,
+    version: str = "",
+    upgrade: bool = False,
+) -> None:
+    """Install several packages via a single pip --user call (Track B).
+
+    Each job is ``(spec, display_name, source)``.  One pip invocation means
+    one interpreter startup and one resolver run for the whole set.
+    """
+    targets = []
+    for spec, _display, source in jobs:
+        if source:
+            targets.append(source)
+        elif version:
+            targets.append(f"{spec}=={version}")
+        else:
+            targets.append(spec)
+
+    cmd = [*python_cmd, "-m", "pip", "install", "--user"]
+    if upgrade:
+        cmd.append("--upgrade")
+    cmd.extend(targets)
+
+    names = ", ".join(display for _spec, display, _source in jobs)
+    info(f"Installing {names} via pip --user (fallback) ...")
+    run_cmd(cmd)
+    _which.cache_clear()
+    ok(f"{names} installed (pip --user)")
+
+
 # ---------------------------------------------------------------------------
 # Verify command on PATH
 # ---------------------------------------------------------------------------
@@ -413,8 +670,9 @@ def pip_install(
 def verify_on_path(name: str, exe_name: str | None = None) -> None:
     """Check if a command is available on PATH after install."""
     exe = exe_name or name
-    if shutil.which(exe):
-        ok(f"{name} on PATH: {shutil.which(exe)}")
+    path = _which(exe)
+    if path:
+        ok(f"{name} on PATH: {path}")
         return
     # Check common locations
     local_bin = Path.home() / ".local" / "bin" / exe
@@ -432,7 +690,12 @@ def verify_on_path(name: str, exe_name: str | None = None) -> None:
 
 
 def resolve_toolbox_source(version: str) -> str:
-    """Resolve the toolbox installation source (local tarball or GitHub URL)."""
+    """Resolve the toolbox installation source.
+
+    Order: current directory, ``release/`` next to this script, the download
+    cache, then a fresh download from GitHub into the cache (falling back to
+    the bare URL if the download fails).
+    """
     tarball = f"adservio-toolbox-{version}.tar.gz"
 
     # Check current directory
@@ -447,10 +710,33 @@ def resolve_toolbox_source(version: str) -> str:
         info(f"Using release/ tarball: {release_tarball}")
         return str(release_tarball)
 
-    # Download from GitHub
+    # Check the download cache (filled by a previous run)
+    cached = RELEASE_CACHE_DIR / tarball
+    if cached.exists():
+        info(f"Using cached tarball: {cached}")
+        return str(cached)
+
     url = f"https://github.com/{GITHUB_REPO}/releases/download/v{version}/{tarball}"
-    info(f"Installing from GitHub release: {url}")
-    return url
+    if DRY_RUN:
+        info(f"Installing from GitHub release: {url}")
+        return url
+
+    # Download once into the cache; pipx/pip then install from disk
+    info(f"Downloading GitHub release: {url}")
+    tmp = cached.with_name(cached.name + ".tmp")
+    try:
+        import urllib.request
+
+        RELEASE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with urllib.request.urlopen(url, timeout=60) as resp, open(tmp, "wb") as fh:
+            shutil.copyfileobj(resp, fh)
+        os.replace(tmp, cached)
+    except Exception as exc:
+        tmp.unlink(missing_ok=True)
+        warn(f"Download failed ({exc}) — installing directly from URL")
+        return url
+    ok(f"Cached release tarball: {cached}")
+    return str(cached)
 
 
 # ===========================================================================
@@ -458,12 +744,13 @@ def resolve_toolbox_source(version: str) -> str:
 # ===========================================================================
 
 
-def do_uninstall(python_cmd: str) -> None:
+def do_uninstall(python_cmd: tuple[str, ...]) -> None:
     """Remove global wiring and uninstall all packages."""
     step(1, "Remove global Claude Code wiring")
 
-    if shutil.which("toolboxctl"):
-        run_cmd(["toolboxctl", "install", "--uninstall"])
+    toolboxctl = _which("toolboxctl")
+    if toolboxctl:
+        run_cmd([toolboxctl, "install", "--uninstall"])
         ok("Global wiring removed")
     else:
         warn("toolboxctl not found — skipping global wiring removal")
@@ -471,25 +758,50 @@ def do_uninstall(python_cmd: str) -> None:
     step(2, "Uninstall packages")
 
     pipx_cmd = find_pipx()
-
-    for pkg in ["adservio-toolbox", "cloakmcp", "memctl"]:
-        if pipx_cmd:
-            result = run_cmd([pipx_cmd, "list", "--short"], check=False, capture=True)
-            if any(line.startswith(f"{pkg} ") for line in result.stdout.splitlines()):
-                info(f"Removing {pkg} (pipx) ...")
-                run_cmd([pipx_cmd, "uninstall", pkg])
+    pipx_pkgs = _pipx_list_short(pipx_cmd) if pipx_cmd else frozenset()
+    packages = ["adservio-toolbox", "cloakmcp", "memctl"]
+
+    # pipx: each package lives in its own venv — remove them in parallel
+    via_pipx = [pkg for pkg in packages if pkg in pipx_pkgs]
+    if via_pipx:
+        info(f"Removing {', '.join(via_pipx)} (pipx) ...")
+        with ThreadPoolExecutor(max_workers=len(via_pipx)) as pool:
+            futures = {
+                pool.submit(
+                    run_cmd, [pipx_cmd, "uninstall", pkg],  # type: ignore[list-item]
+                    check=False, prefix=f"  [{pkg}] ",
+                ): pkg
+                for pkg in via_pipx
+            }
+            for future in as_completed(futures):
+                pkg = futures[future]
+                if future.result().returncode == 0:
+                    ok(f"{pkg} uninstalled")
+                else:
+                    warn(f"{pkg}: pipx uninstall failed")
+        _pipx_list_short.cache_clear()
+
+    # pip: one probe and one uninstall call for the remaining packages
+    rest = [pkg for pkg in packages if pkg not in pipx_pkgs]
+    if rest:
+        result = run_cmd(
+            [*python_cmd, "-m", "pip", "list", "--format=freeze"],
+            check=False, capture=True,
+        )
+        installed = {
+            line.split("==", 1)[0].strip().lower().replace("_", "-")
+            for line in result.stdout.splitlines()
+            if "==" in line
+        }
+        via_pip = [pkg for pkg in rest if pkg in installed]
+        for pkg in rest:
+            if pkg not in installed:
+                info(f"{pkg} not installed — skipping")
+        if via_pip:
+            info(f"Removing {', '.join(via_pip)} (pip) ...")
+            run_cmd([*python_cmd, "-m", "pip", "uninstall", "-y", *via_pip])
+            for pkg in via_pip:
                 ok(f"{pkg} uninstalled")
-                continue
-
-        # Try pip
-        args = python_cmd.split() + ["-m", "pip", "show", pkg]
-        result = run_cmd(args, check=False, capture=True)
-        if result.returncode == 0:
-            info(f"Removing {pkg} (pip) ...")
-            run_cmd(python_cmd.split() + ["-m", "pip", "uninstall", "-y", pkg])
-            ok(f"{pkg} uninstalled")
-        else:
-            info(f"{pkg} not installed — skipping")
 
     print()
     ok("Uninstall complete.")
@@ -503,7 +815,7 @@ def do_uninstall(python_cmd: str) -> None:
 def do_install(args: argparse.Namespace) -> None:
     """Main install flow."""
     print()
-    print(f"{_B}Adservio Claude Code Toolbox — Installer{_R}")
+    print(_bold("Adservio Claude Code Toolbox — Installer"))
     print()
     info(f"Prerequisites: Python {MIN_PYTHON[0]}.{MIN_PYTHON[1]}+")
     print()
@@ -516,8 +828,8 @@ def do_install(args: argparse.Namespace) -> None:
         print_python_hint()
         sys.exit(2)
 
-    python_cmd, python_ver = python_info
-    ok(f"Python {python_ver} ({python_cmd})")
+    python_cmd, python_ver, caps = python_info
+    ok(f"Python {python_ver} ({' '.join(python_cmd)})")
 
     # --- 1b: Check pipx health first (pipx-first policy) ---
     # If pipx is already present and functional, pip is not needed at all.
@@ -528,15 +840,15 @@ def do_install(args: argparse.Namespace) -> None:
         pipx_ready = True
         ok(f"pipx functional ({existing_pipx})")
 
-    # --- 1c: Probe pip/venv/PEP668 only if pipx is not ready ---
+    # --- 1c: Check pip/venv/PEP668 (probed by find_python) if pipx is not ready ---
     has_pip = False
     has_venv = False
     is_pep668 = False
 
     if not pipx_ready:
-        has_pip = probe_pip(python_cmd)
-        has_venv = probe_venv(python_cmd)
-        is_pep668 = probe_pep668(python_cmd)
+        has_pip = caps["pip"]
+        has_venv = caps["venv"]
+        is_pep668 = caps["pep668"]
 
         if has_pip:
             ok("pip available (for pipx bootstrap)")
@@ -584,60 +896,77 @@ def do_install(args: argparse.Namespace) -> None:
 
     use_pipx = install_track == "A" and pipx_cmd_str is not None
 
-    # ── Step 3: Install memctl ───────────────────────────────────────────
-    step(3, "Install memctl")
-
-    if use_pipx:
-        pipx_install(
-            pipx_cmd_str, MEMCTL_SPEC, "memctl",  # type: ignore[arg-type]
+    # Resolved (and possibly downloaded) at most once, and only by an
+    # install that uses it: pipx upgrades and no-op runs never touch it.
+    tb_version = args.version or TOOLBOX_VERSION
+    tb_source = functools.cache(functools.partial(resolve_toolbox_source, tb_version))
+
+    if not use_pipx:
+        # ── Steps 3–5: Install memctl, CloakMCP, adservio-toolbox ────────
+        step(3, "Install memctl, CloakMCP, adservio-toolbox (single pip call)")
+        pip_install_batch(
+            python_cmd,
+            [
+                (MEMCTL_SPEC, "memctl", ""),
+                (CLOAKMCP_SPEC, "cloakmcp", ""),
+                (TOOLBOX_SPEC, "adservio-toolbox", tb_source()),
+            ],
             version=args.version, upgrade=args.upgrade,
         )
+        step(4, "Verify commands on PATH")
+        verify_on_path("memctl")
+        verify_on_path("CloakMCP", "cloak")
+        step(5, "Verify toolboxctl on PATH")
+        verify_on_path("toolboxctl")
+    elif args.jobs > 1 and not DRY_RUN:
+        # ── Steps 3–5: Install all three via concurrent pipx jobs ────────
+        step(3, "Install memctl, CloakMCP, adservio-toolbox (parallel pipx)")
+        pipx_install_many(
+            pipx_cmd_str,  # type: ignore[arg-type]
+            [
+                {"spec": MEMCTL_SPEC, "display": "memctl"},
+                {"spec": CLOAKMCP_SPEC, "display": "cloakmcp"},
+                {"spec": TOOLBOX_SPEC, "display": "adservio-toolbox",
+                 "source": tb_source},
+            ],
+            version=args.version, upgrade=args.upgrade, max_workers=args.jobs,
+        )
+        step(4, "Verify commands on PATH")
+        verify_on_path("memctl")
+        verify_on_path("CloakMCP", "cloak")
+        step(5, "Verify toolboxctl on PATH")
+        verify_on_path("toolboxctl")
     else:
-        pip_install(
-            python_cmd, MEMCTL_SPEC, "memctl",
+        # ── Step 3: Install memctl ───────────────────────────────────────
+        step(3, "Install memctl")
+        pipx_install(
+            pipx_cmd_str, MEMCTL_SPEC, "memctl",  # type: ignore[arg-type]
             version=args.version, upgrade=args.upgrade,
         )
-    verify_on_path("memctl")
+        verify_on_path("memctl")
 
-    # ── Step 4: Install CloakMCP ─────────────────────────────────────────
-    step(4, "Install CloakMCP")
-
-    if use_pipx:
+        # ── Step 4: Install CloakMCP ─────────────────────────────────────
+        step(4, "Install CloakMCP")
         pipx_install(
             pipx_cmd_str, CLOAKMCP_SPEC, "cloakmcp",  # type: ignore[arg-type]
             version=args.version, upgrade=args.upgrade,
         )
-    else:
-        pip_install(
-            python_cmd, CLOAKMCP_SPEC, "cloakmcp",
-            version=args.version, upgrade=args.upgrade,
-        )
-    verify_on_path("CloakMCP", "cloak")
+        verify_on_path("CloakMCP", "cloak")
 
-    # ── Step 5: Install adservio-toolbox ─────────────────────────────────
-    step(5, "Install adservio-toolbox")
-
-    tb_version = args.version or TOOLBOX_VERSION
-    tb_source = resolve_toolbox_source(tb_version)
-
-    if use_pipx:
+        # ── Step 5: Install adservio-toolbox ─────────────────────────────
+        step(5, "Install adservio-toolbox")
         pipx_install(
             pipx_cmd_str, TOOLBOX_SPEC, "adservio-toolbox",  # type: ignore[arg-type]
             version=args.version, upgrade=args.upgrade, source=tb_source,
         )
-    else:
-        pip_install(
-            python_cmd, TOOLBOX_SPEC, "adservio-toolbox",
-            version=args.version, upgrade=args.upgrade, source=tb_source,
-        )
-    verify_on_path("toolboxctl")
+        verify_on_path("toolboxctl")
 
     # ── Step 6: Wire Claude Code globally ────────────────────────────────
     step(6, "Wire Claude Code globally")
 
     if args.skip_global:
         info("Skipped (--skip-global). Run 'toolboxctl install --global' later.")
-    elif shutil.which("toolboxctl"):
+    elif _which("toolboxctl"):
         run_cmd(["toolboxctl", "install", "--global"])
         ok("Global wiring complete")
     else:
@@ -647,7 +976,7 @@ def do_install(args: argparse.Namespace) -> None:
     # ── Step 7: Doctor ───────────────────────────────────────────────────
     step(7, "Verify installation")
 
-    if shutil.which("toolboxctl"):
+    if _which("toolboxctl"):
         run_cmd(["toolboxctl", "doctor"])
     else:
         warn("toolboxctl not on PATH — skipping doctor.")
@@ -655,7 +984,7 @@ def do_install(args: argparse.Namespace) -> None:
 
     # ── Summary ──────────────────────────────────────────────────────────
     print()
-    print(f"{_B}=== Installation complete ==={_R}")
+    print(_bold("=== Installation complete ==="))
     print()
 
     track_desc = "pipx" if use_pipx else "pip --user"
@@ -704,6 +1033,10 @@ def main() -> None:
         "--upgrade", action="store_true",
         help="Upgrade existing installations",
     )
+    parser.add_argument(
+        "--jobs", type=int, default=3, metavar="N",
+        help="Parallel pipx installs on the pipx track (default: 3; 1 = serial)",
+    )
     parser.add_argument(
         "--uninstall", action="store_true",
         help="Remove global wiring and uninstall all packages",
@@ -720,7 +1053,7 @@ def main() -> None:
 
     if args.uninstall:
         python_info = find_python()
-        python_cmd = python_info[0] if python_info else "python3"
+        python_cmd = python_info[0] if python_info else ("python3",)
         do_uninstall(python_cmd)
         sys.exit(0)
 
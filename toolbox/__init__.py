@@ -1,8 +1,26 @@
-"""Adservio Claude Code Toolbox — installer, configurator, and developer assets."""
+"""Adservio Claude Code Toolbox — installer, configurator, and developer assets.
 
-from importlib.metadata import version as _pkg_version
+Nothing is imported eagerly here: every ``toolboxctl`` run executes this
+file, so ``__version__`` is resolved on first access via ``__getattr__``.
+"""
 
-try:
-    __version__ = _pkg_version("adservio-toolbox")
-except Exception:
-    __version__ = "0.5.3"  # fallback for editable installs without metadata
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = ["__version__"]
+
+_FALLBACK_VERSION = "0.5.3"  # fallback for editable installs without metadata
+
+
+def __getattr__(name: str) -> Any:
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib.metadata import version as _pkg_version
+
+    try:
+        value = _pkg_version("adservio-toolbox")
+    except Exception:
+        value = _FALLBACK_VERSION
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
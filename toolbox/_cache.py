@@ -0,0 +1,13 @@
+"""Per-user cache directory for best-effort, disposable lookups.
+
+Entries live under ``$XDG_CACHE_HOME/adservio-toolbox`` (``~/.cache`` when
+unset).  Anything stored here may be deleted at any time: every reader
+treats a missing, stale or unreadable entry as a miss and recomputes.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "adservio-toolbox"
@@ -0,0 +1,136 @@
+"""JSON file I/O shared by the global, eco and project (init) wiring.
+
+Several modules read and rewrite Claude Code settings files; routing them
+through one read cache and one writer keeps a single toolboxctl run from
+reading or serializing the same file twice.
+
+- File bytes are cached per path, keyed on ``(mtime_ns, size)``.
+- Writes encode to bytes once and replace the target atomically.
+- ``orjson`` is used when installed (optional, not a dependency); the
+  JSON codec is imported on first use, not at module import.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import stat
+from pathlib import Path
+from typing import Any
+
+from toolbox.helpers import warn
+
+# Raw JSON files keyed by path → ((mtime_ns, size), file bytes).  Bytes,
+# not parsed dicts: one C-level parse per call yields a fresh mutable tree
+# more cheaply than deep-copying a cached one.
+_JSON_CACHE: dict[Path, tuple[tuple[int, int], bytes]] = {}
+
+
+@functools.cache
+def _orjson() -> Any:
+    """Return the optional ``orjson`` module, or None (imported on first use)."""
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except ModuleNotFoundError:
+        return None
+    return orjson
+
+
+def loads(raw: bytes | str) -> dict:
+    """Parse JSON bytes or text (orjson when available, stdlib otherwise)."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+
+    return json.loads(raw)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize *data* as 2-space-indented UTF-8 JSON with a trailing newline."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    import json
+
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def print_json(data: Any) -> None:
+    """Write *data* to stdout as indented JSON bytes, bypassing text encoding."""
+    import sys
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps(data))
+    sys.stdout.buffer.flush()
+
+
+def load_json(path: Path) -> dict:
+    """Parse a JSON file, reusing its bytes while the file is unchanged.
+
+    Raises FileNotFoundError if *path* is missing and ValueError if it is
+    not valid JSON.  Returns a fresh dict: callers may mutate it.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, path.read_bytes())
+        _JSON_CACHE[path] = cached
+    return loads(cached[1])
+
+
+def read_json(path: Path) -> dict:
+    """Read a JSON file, returning {} if it doesn't exist or is empty."""
+    try:
+        return load_json(path)
+    except FileNotFoundError:
+        return {}
+    except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+        warn(f"Could not parse {path} — treating as empty.")
+        return {}
+
+
+def read_json_if_contains(path: Path, needle: bytes) -> dict | None:
+    """Like :func:`read_json`, but parse only if the raw file contains *needle*.
+
+    Returns None when *path* is missing or *needle* does not occur, so
+    callers looking for their own entries skip parsing files that cannot
+    hold any.  A byte probe may yield false positives, never false negatives.
+    """
+    try:
+        st = path.stat()
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    _JSON_CACHE[path] = ((st.st_mtime_ns, st.st_size), raw)
+    if needle not in raw:
+        return None
+    try:
+        return loads(raw)
+    except ValueError:
+        warn(f"Could not parse {path} — treating as empty.")
+        return {}
+
+
+def write_json(path: Path, data: dict) -> None:
+    """Write a JSON file with consistent formatting."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, dumps(data))
+    _JSON_CACHE.pop(path, None)
+
+
+def atomic_write(path: Path, payload: bytes) -> None:
+    """Replace *path* with *payload* in one write plus a rename.
+
+    Readers (Claude Code itself) never observe a half-written file.  A
+    symlinked target is written through, and an existing mode is kept.
+    """
+    target = path.resolve() if path.is_symlink() else path
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(payload)
+    try:
+        os.chmod(tmp, stat.S_IMODE(os.stat(target).st_mode))
+    except FileNotFoundError:
+        pass
+    os.replace(tmp, target)
@@ -14,16 +14,22 @@ On POSIX the ``.sh`` path is returned unchanged.
 
 from __future__ import annotations
 
-import shutil
+import functools
 import sys
 from pathlib import Path
 
 IS_WINDOWS = sys.platform == "win32"
 
 
+@functools.cache
 def _python_cmd() -> str:
-    """Return the Python interpreter command appropriate for the platform."""
+    """Return the Python interpreter command appropriate for the platform.
+
+    Cached: the answer is fixed for the lifetime of the process.
+    """
     if IS_WINDOWS:
+        import shutil
+
         # Prefer py launcher, fall back to python
         if shutil.which("py"):
             return "py -3"
@@ -31,6 +37,12 @@ def _python_cmd() -> str:
     return "python3"
 
 
+@functools.lru_cache(maxsize=512)
+def _exists(path: str) -> bool:
+    """Cached ``Path.exists`` for hook variants (stable during one command)."""
+    return Path(path).exists()
+
+
 def resolve_hook_command(sh_path: str) -> str:
     """Return the OS-appropriate hook command for a given ``.sh`` hook path.
 
@@ -43,11 +55,11 @@ def resolve_hook_command(sh_path: str) -> str:
     base = sh_path.removesuffix(".sh") if sh_path.endswith(".sh") else sh_path
 
     py_path = base + ".py"
-    if Path(py_path).exists():
+    if _exists(py_path):
         return f"{_python_cmd()} {py_path}"
 
     cmd_path = base + ".cmd"
-    if Path(cmd_path).exists():
+    if _exists(cmd_path):
         return cmd_path
 
     # Fallback: Git Bash may be installed
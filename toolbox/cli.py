@@ -7,25 +7,28 @@ from __future__ import annotations
 
 import argparse
 import sys
+from typing import Callable
 
-from toolbox import __version__
 
+class _LazyVersion(argparse.Action):
+    """``--version`` action that imports the version only when invoked."""
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="toolboxctl",
-        description="Adservio Claude Code Toolbox — installer, configurator, and developer assets.",
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"toolboxctl {__version__}",
-    )
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        super().__init__(option_strings, dest=dest, nargs=0, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from toolbox import __version__
+
+        print(f"toolboxctl {__version__}")
+        parser.exit()
 
-    sub = parser.add_subparsers(dest="command")
-    sub.required = True
 
-    # --- install -----------------------------------------------------------
+# ---------------------------------------------------------------------------
+# Subparser builders (one per subcommand, registered on demand)
+# ---------------------------------------------------------------------------
+
+
+def _add_install(sub: argparse._SubParsersAction) -> None:
     p_install = sub.add_parser("install", help="Install memctl + CloakMCP")
     p_install.add_argument(
         "--fts",
@@ -50,7 +53,8 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Remove global Claude Code wiring (hooks, permissions, CLAUDE.md block)",
     )
 
-    # --- init --------------------------------------------------------------
+
+def _add_init(sub: argparse._SubParsersAction) -> None:
     p_init = sub.add_parser("init", help="Wire .claude/ commands, config, CLAUDE.md block, and manifest")
     p_init.add_argument(
         "--force",
@@ -70,7 +74,8 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Wiring profile (default: minimal)",
     )
 
-    # --- deinit ------------------------------------------------------------
+
+def _add_deinit(sub: argparse._SubParsersAction) -> None:
     p_deinit = sub.add_parser("deinit", help="Remove toolbox wiring (preserves .memory/, hooks, user content)")
     p_deinit.add_argument(
         "--force",
@@ -78,13 +83,20 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Skip confirmation prompt",
     )
 
-    # --- update ------------------------------------------------------------
+
+def _add_update(sub: argparse._SubParsersAction) -> None:
     p_update = sub.add_parser("update", help="Upgrade memctl, CloakMCP, and toolbox via pipx/pip")
     p_update.add_argument(
         "--check",
         action="store_true",
         help="Show outdated packages without upgrading",
     )
+    p_update.add_argument(
+        "--refresh",
+        action="store_true",
+        help="With --check, ignore cached PyPI versions; otherwise refresh "
+             "project templates even if unchanged",
+    )
     p_update.add_argument(
         "--quiet",
         action="store_true",
@@ -104,10 +116,12 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Refresh only the project CLAUDE.md block",
     )
 
-    # --- status ------------------------------------------------------------
+
+def _add_status(sub: argparse._SubParsersAction) -> None:
     sub.add_parser("status", help="Show deterministic status report")
 
-    # --- doctor ------------------------------------------------------------
+
+def _add_doctor(sub: argparse._SubParsersAction) -> None:
     p_doctor = sub.add_parser("doctor", help="Diagnose toolbox installation health")
     p_doctor.add_argument(
         "--strict", action="store_true",
@@ -118,7 +132,8 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Alias for --strict",
     )
 
-    # --- eco ---------------------------------------------------------------
+
+def _add_eco(sub: argparse._SubParsersAction) -> None:
     p_eco = sub.add_parser("eco", help="Toggle eco mode")
     p_eco.add_argument(
         "action",
@@ -128,7 +143,8 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Enable or disable eco mode (omit to show current state)",
     )
 
-    # --- env ---------------------------------------------------------------
+
+def _add_env(sub: argparse._SubParsersAction) -> None:
     p_env = sub.add_parser("env", help="Export config as env vars")
     p_env.add_argument(
         "--json",
@@ -136,7 +152,8 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Output as JSON instead of shell exports",
     )
 
-    # --- playground --------------------------------------------------------
+
+def _add_playground(sub: argparse._SubParsersAction) -> None:
     p_pg = sub.add_parser("playground", help="Create playground venv with smoke tests")
     p_pg.add_argument(
         "--clean",
@@ -144,7 +161,8 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Remove existing playground",
     )
 
-    # --- rescue ------------------------------------------------------------
+
+def _add_rescue(sub: argparse._SubParsersAction) -> None:
     p_rescue = sub.add_parser("rescue", help="Guided secret recovery (CloakMCP)")
     p_rescue.add_argument("--dir", default=".", help="Target directory (default: .)")
     p_rescue.add_argument(
@@ -169,12 +187,72 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_rescue.add_argument("--json", action="store_true", help="Output combined diagnostic as JSON to stdout")
 
+
+_SUBPARSER_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "install": _add_install,
+    "init": _add_init,
+    "deinit": _add_deinit,
+    "update": _add_update,
+    "status": _add_status,
+    "doctor": _add_doctor,
+    "eco": _add_eco,
+    "env": _add_env,
+    "playground": _add_playground,
+    "rescue": _add_rescue,
+}
+
+
+def _sniff_subcommand(argv: list[str] | None) -> str | None:
+    """Return the subcommand named in *argv*, or None if there is none.
+
+    Only the first positional token counts (top-level options come first).
+    A top-level ``-h``/``--help`` also returns None so the full command
+    list is shown.
+    """
+    for token in argv or ():
+        if token in ("-h", "--help"):
+            return None
+        if token.startswith("-"):
+            continue
+        return token if token in _SUBPARSER_BUILDERS else None
+    return None
+
+
+def _build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    When *argv* names a known subcommand, only that subparser is
+    registered; otherwise (``--help``, typos, no command) all of them are,
+    so argparse can list the choices.
+    """
+    parser = argparse.ArgumentParser(
+        prog="toolboxctl",
+        description="Adservio Claude Code Toolbox — installer, configurator, and developer assets.",
+    )
+    parser.add_argument(
+        "--version",
+        action=_LazyVersion,
+        help="show program's version number and exit",
+    )
+
+    sub = parser.add_subparsers(dest="command")
+    sub.required = True
+
+    command = _sniff_subcommand(argv)
+    if command is not None:
+        _SUBPARSER_BUILDERS[command](sub)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(sub)
+
     return parser
 
 
 def main(argv: list[str] | None = None) -> None:
     """Parse arguments and dispatch to the appropriate subcommand."""
-    parser = _build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _build_parser(argv)
     args = parser.parse_args(argv)
 
     # Lazy imports per subcommand (fast startup)
@@ -8,18 +8,13 @@ The module never imports memctl or CloakMCP.
 
 from __future__ import annotations
 
+import functools
+import io
 import os
+from itertools import chain
 from pathlib import Path
-from typing import Any
-
-# ---------------------------------------------------------------------------
-# TOML reader (stdlib 3.11+ / tomli fallback for 3.10)
-# ---------------------------------------------------------------------------
-
-try:
-    import tomllib  # type: ignore[import-not-found]
-except ModuleNotFoundError:
-    import tomli as tomllib  # type: ignore[import-untyped,no-redef]
+from types import MappingProxyType
+from typing import Any, Callable
 
 # ---------------------------------------------------------------------------
 # Compiled defaults
@@ -56,6 +51,17 @@ ENV_MAP: dict[tuple[str, str], str] = {
     ("cloak", "fail_closed"): "CLOAK_FAIL_CLOSED",
 }
 
+# Read-only views of DEFAULTS, returned when nothing overrides them
+_DEFAULTS_VIEW: dict[str, MappingProxyType[str, Any]] = {
+    section: MappingProxyType(values) for section, values in DEFAULTS.items()
+}
+
+# Flattened ENV_MAP: (section, key, env_var, default) — built once at import
+_ENV_ENTRIES: tuple[tuple[str, str, str, Any], ...] = tuple(
+    (section, key, env_var, DEFAULTS[section][key])
+    for (section, key), env_var in ENV_MAP.items()
+)
+
 
 # ---------------------------------------------------------------------------
 # Config discovery
@@ -63,9 +69,17 @@ ENV_MAP: dict[tuple[str, str], str] = {
 
 
 def find_config(start: Path | None = None) -> Path | None:
-    """Walk up from *start* (default: cwd) looking for CONFIG_FILENAME."""
-    current = (start or Path.cwd()).resolve()
-    for directory in [current, *current.parents]:
+    """Walk up from *start* (default: cwd) looking for CONFIG_FILENAME.
+
+    The walk is memoized per resolved start directory for the life of the
+    process (CLI runs are short); :func:`write_config` clears the cache.
+    """
+    return _find_config_cached((start or Path.cwd()).resolve())
+
+
+@functools.cache
+def _find_config_cached(current: Path) -> Path | None:
+    for directory in chain((current,), current.parents):
         candidate = directory / CONFIG_FILENAME
         if candidate.is_file():
             return candidate
@@ -78,7 +92,17 @@ def find_config(start: Path | None = None) -> Path | None:
 
 
 def load_toml(path: Path) -> dict[str, Any]:
-    """Parse a TOML file and return a dict."""
+    """Parse a TOML file and return a dict.
+
+    The TOML reader (stdlib 3.11+ / tomli fallback for 3.10) is imported
+    here rather than at module level, so commands run without a config
+    file never pay for it.
+    """
+    try:
+        import tomllib  # type: ignore[import-not-found]
+    except ModuleNotFoundError:
+        import tomli as tomllib  # type: ignore[import-untyped,no-redef]
+
     with open(path, "rb") as fh:
         return tomllib.load(fh)
 
@@ -92,41 +116,68 @@ def load_config(path: Path | None = None) -> dict[str, dict[str, Any]]:
     """Return the fully-resolved configuration dict.
 
     Merge order: compiled defaults ← TOML file ← env vars.
+
+    When neither a config file nor an env override applies, the sections
+    are read-only views of :data:`DEFAULTS` (no copy is made).  Callers only
+    mutate a config they are about to write back, which requires a file.
     """
+    config_path = path or find_config()
+    has_file = config_path is not None and config_path.is_file()
+    env_overrides = [
+        (section, key, env_val, default_val)
+        for section, key, env_var, default_val in _ENV_ENTRIES
+        if (env_val := os.environ.get(env_var)) is not None
+    ]
+
+    # Fast path: nothing to merge
+    if not has_file and not env_overrides:
+        return dict(_DEFAULTS_VIEW)  # type: ignore[arg-type]
+
     # Start with defaults (deep copy)
     cfg: dict[str, dict[str, Any]] = {
         section: dict(values) for section, values in DEFAULTS.items()
     }
 
     # Layer: TOML file
-    config_path = path or find_config()
-    if config_path and config_path.is_file():
-        file_data = load_toml(config_path)
+    if has_file:
+        file_data = load_toml(config_path)  # type: ignore[arg-type]
         for section, values in file_data.items():
             if isinstance(values, dict) and section in cfg:
                 cfg[section].update(values)
 
     # Layer: env vars (highest precedence)
-    for (section, key), env_var in ENV_MAP.items():
-        env_val = os.environ.get(env_var)
-        if env_val is not None:
-            # Coerce to the type of the default value
-            default_val = DEFAULTS.get(section, {}).get(key)
-            cfg.setdefault(section, {})[key] = _coerce(env_val, default_val)
+    for section, key, env_val, default_val in env_overrides:
+        # Coerce to the type of the default value
+        cfg[section][key] = _coerce(env_val, default_val)
 
     return cfg
 
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def _coerce_bool(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+def _coerce_int(value: str) -> int | str:
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+# Keyed on the exact type, so bool never falls through to int
+_COERCERS: dict[type, Callable[[str], Any]] = {
+    bool: _coerce_bool,
+    int: _coerce_int,
+}
+
+
 def _coerce(value: str, reference: Any) -> Any:
     """Coerce a string env value to the type of the reference default."""
-    if isinstance(reference, bool):
-        return value.lower() in ("1", "true", "yes", "on")
-    if isinstance(reference, int):
-        try:
-            return int(value)
-        except ValueError:
-            return value
-    return value
+    coercer = _COERCERS.get(type(reference))
+    return coercer(value) if coercer else value
 
 
 # ---------------------------------------------------------------------------
@@ -137,7 +188,7 @@ def _coerce(value: str, reference: Any) -> Any:
 def config_to_env(cfg: dict[str, dict[str, Any]]) -> dict[str, str]:
     """Convert a resolved config dict to a flat {ENV_VAR: value} mapping."""
     result: dict[str, str] = {}
-    for (section, key), env_var in ENV_MAP.items():
+    for section, key, env_var, _default in _ENV_ENTRIES:
         val = cfg.get(section, {}).get(key)
         if val is not None:
             if isinstance(val, bool):
@@ -152,15 +203,34 @@ def config_to_env(cfg: dict[str, dict[str, Any]]) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
+_TOML_ESCAPES = {
+    ord("\\"): "\\\\",
+    ord('"'): '\\"',
+    ord("\b"): "\\b",
+    ord("\t"): "\\t",
+    ord("\n"): "\\n",
+    ord("\f"): "\\f",
+    ord("\r"): "\\r",
+    **{c: f"\\u{c:04X}" for c in (*range(0x00, 0x08), 0x0B, *range(0x0E, 0x20), 0x7F)},
+}
+
+
+def _escape_toml_str(v: str) -> str:
+    """Serialize *v* as a TOML basic string (quoted, escaped)."""
+    return f'"{v.translate(_TOML_ESCAPES)}"'
+
+
+_TOML_WRITERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: repr,
+    str: _escape_toml_str,
+}
+
+
 def _toml_value(v: Any) -> str:
     """Serialize a single value to TOML syntax."""
-    if isinstance(v, bool):
-        return "true" if v else "false"
-    if isinstance(v, int):
-        return str(v)
-    if isinstance(v, str):
-        return f'"{v}"'
-    return str(v)
+    return _TOML_WRITERS.get(type(v), str)(v)
 
 
 def write_config(cfg: dict[str, dict[str, Any]], path: Path) -> None:
@@ -168,14 +238,14 @@ def write_config(cfg: dict[str, dict[str, Any]], path: Path) -> None:
 
     Uses a minimal hand-rolled serializer (flat tables, no nested tables).
     """
-    lines: list[str] = [
-        "# Adservio Claude Code Toolbox — configuration",
-        "# Precedence: CLI flags > env vars > this file > compiled defaults",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(
+        "# Adservio Claude Code Toolbox — configuration\n"
+        "# Precedence: CLI flags > env vars > this file > compiled defaults\n"
+    )
     for section, values in cfg.items():
-        lines.append(f"[{section}]")
+        buf.write(f"\n[{section}]\n")
         for k, v in values.items():
-            lines.append(f"{k} = {_toml_value(v)}")
-        lines.append("")
-    path.write_text("\n".join(lines), encoding="utf-8")
+            buf.write(f"{k} = {_toml_value(v)}\n")
+    path.write_text(buf.getvalue(), encoding="utf-8")
+    _find_config_cached.cache_clear()
@@ -8,12 +8,15 @@ Exit codes: 0 = all green, 1 = warnings, 2 = critical missing.
 
 from __future__ import annotations
 
+import functools
+import os
 import platform
+import re
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from toolbox import __version__
 from toolbox._platform import IS_WINDOWS, resolve_hook_command
 from toolbox.helpers import _green, _red, _yellow, info, print_table, run, warn
 
@@ -35,41 +38,57 @@ def _check_mark(status: str) -> str:
     return _red("\u2717")
 
 
-def _cmd_version(cmd: str) -> str | None:
-    """Get version from a CLI tool, or None if not found."""
-    path = shutil.which(cmd)
-    if not path:
-        return None
+@functools.lru_cache(maxsize=32)
+def _which(cmd: str) -> str | None:
+    """Cached ``shutil.which`` — each name is probed once per doctor run."""
+    return shutil.which(cmd)
+
+
+@functools.lru_cache(maxsize=16)
+def _version_prefix_re(cmd: str) -> re.Pattern[str]:
+    """Pattern for the ``"<cmd> "`` then ``"v"`` prefixes of a version line."""
+    return re.compile(rf"^(?:{re.escape(cmd)}\s+)?v?", re.IGNORECASE)
+
+
+def _extract_version(cmd: str) -> str:
+    """Run ``cmd --version`` and return a cleaned-up version string.
+
+    The caller has already located *cmd* on PATH.
+    """
     # Try --version first
     result = run([cmd, "--version"], check=False, quiet=True)
     if result.returncode == 0 and result.stdout.strip():
         # Take first line, strip common prefixes
         line = result.stdout.strip().splitlines()[0]
-        for prefix in [f"{cmd} ", "v"]:
-            if line.lower().startswith(prefix):
-                line = line[len(prefix):]
-        return line.strip()
+        return _version_prefix_re(cmd).sub("", line, count=1).strip()
     # Fallback: just report "found"
     return "found"
 
 
+def _cmd_version(cmd: str) -> str | None:
+    """Get version from a CLI tool, or None if not found."""
+    if not _which(cmd):
+        return None
+    return _extract_version(cmd)
+
+
 def _pip_version(pip_name: str) -> str | None:
-    """Return the installed version of a pip package, or None."""
-    result = run(
-        [sys.executable, "-m", "pip", "show", pip_name],
-        check=False, quiet=True,
-    )
-    if result.returncode != 0:
+    """Return the installed version of a pip package, or None.
+
+    Reads the distribution metadata of the running interpreter in-process
+    (same environment ``sys.executable -m pip show`` would inspect).
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(pip_name)
+    except PackageNotFoundError:
         return None
-    for line in result.stdout.splitlines():
-        if line.startswith("Version:"):
-            return line.split(":", 1)[1].strip()
-    return None
 
 
 def _pipx_available() -> str | None:
     """Return pipx version if available, else None."""
-    pipx = shutil.which("pipx")
+    pipx = _which("pipx")
     if not pipx:
         return None
     result = run(["pipx", "--version"], check=False, quiet=True)
@@ -78,12 +97,9 @@ def _pipx_available() -> str | None:
     return "found"
 
 
-def _detect_install_method(cmd: str) -> str:
-    """Detect how a tool was installed (pipx, pip, or unknown)."""
-    path = shutil.which(cmd)
-    if not path:
-        return "not found"
-    path_str = str(Path(path).resolve())
+def _classify_path(path: str) -> str:
+    """Classify an executable path as pipx, pip/venv, or system."""
+    path_str = os.path.realpath(path)
     if "pipx" in path_str or ".local/pipx" in path_str:
         return "pipx"
     if "site-packages" in path_str or ".venv" in path_str:
@@ -91,6 +107,22 @@ def _detect_install_method(cmd: str) -> str:
     return "system"
 
 
+def _detect_install_method(cmd: str) -> str:
+    """Detect how a tool was installed (pipx, pip, or unknown)."""
+    path = _which(cmd)
+    if not path:
+        return "not found"
+    return _classify_path(path)
+
+
+def _probe_tool(cmd: str) -> tuple[str | None, str]:
+    """Return (version or None, install method) with a single PATH lookup."""
+    path = _which(cmd)
+    if not path:
+        return None, "not found"
+    return _extract_version(cmd), _classify_path(path)
+
+
 # ---------------------------------------------------------------------------
 # Policy lint (doctrine enforcement)
 # ---------------------------------------------------------------------------
@@ -172,6 +204,8 @@ def _lint_policy_overlap(cwd: Path) -> list[tuple[str, str, str, str]]:
 
 def cmd_doctor(args) -> None:
     """Entry point for ``toolboxctl doctor``."""
+    from toolbox import __version__
+
     # Lazy import to avoid circular dependency
     from toolbox.global_wiring import (
         check_global_claude_md,
@@ -195,8 +229,23 @@ def cmd_doctor(args) -> None:
         "" if py_ok else "3.10+ required",
     ))
 
+    # --- Probes (subprocess/IO-bound — run concurrently) -----------------
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            "pipx": pool.submit(_pipx_available),
+            "claude": pool.submit(_cmd_version, "claude"),
+            "memctl": pool.submit(_probe_tool, "memctl"),
+            "cloak": pool.submit(_probe_tool, "cloak"),
+            "toolboxctl": pool.submit(_detect_install_method, "toolboxctl"),
+            # Independent ~/.claude/ reads overlap with the probes above
+            "hooks": pool.submit(check_global_hooks),
+            "perms": pool.submit(check_global_permissions),
+            "claude_md": pool.submit(check_global_claude_md),
+        }
+    probes = {name: future.result() for name, future in futures.items()}
+
     # --- pipx -------------------------------------------------------------
-    pipx_ver = _pipx_available()
+    pipx_ver = probes["pipx"]
     if pipx_ver:
         checks.append(("pipx", pipx_ver, _OK, ""))
     else:
@@ -204,7 +253,7 @@ def cmd_doctor(args) -> None:
         has_warn = True
 
     # --- Claude Code ------------------------------------------------------
-    claude_ver = _cmd_version("claude")
+    claude_ver = probes["claude"]
     if claude_ver:
         checks.append(("Claude Code", claude_ver, _OK, ""))
     else:
@@ -212,30 +261,28 @@ def cmd_doctor(args) -> None:
         has_warn = True
 
     # --- memctl -----------------------------------------------------------
-    memctl_ver = _cmd_version("memctl")
+    memctl_ver, method = probes["memctl"]
     if memctl_ver:
-        method = _detect_install_method("memctl")
         checks.append(("memctl", memctl_ver, _OK, f"({method})"))
     else:
         checks.append(("memctl", "not installed", _FAIL, "toolboxctl install"))
         has_fail = True
 
     # --- CloakMCP ---------------------------------------------------------
-    cloak_ver = _cmd_version("cloak")
+    cloak_ver, method = probes["cloak"]
     if cloak_ver:
-        method = _detect_install_method("cloak")
         checks.append(("CloakMCP", cloak_ver, _OK, f"({method})"))
     else:
         checks.append(("CloakMCP", "not installed", _FAIL, "toolboxctl install"))
         has_fail = True
 
     # --- toolboxctl -------------------------------------------------------
-    method = _detect_install_method("toolboxctl")
+    method = probes["toolboxctl"]
     checks.append(("toolboxctl", __version__, _OK, f"({method})"))
 
     # --- PATH resolution --------------------------------------------------
     path_cmds = ["cloak", "memctl"]
-    missing_path = [c for c in path_cmds if not shutil.which(c)]
+    missing_path = [c for c in path_cmds if not _which(c)]
     if not missing_path:
         checks.append(("PATH", ", ".join(path_cmds), _OK, "all on PATH"))
     else:
@@ -248,7 +295,7 @@ def cmd_doctor(args) -> None:
         has_warn = True
 
     # --- Global hooks -----------------------------------------------------
-    hooks_state = check_global_hooks()
+    hooks_state = probes["hooks"]
     if hooks_state["installed"]:
         events = ", ".join(hooks_state["events"])
         checks.append((
@@ -268,16 +315,15 @@ def cmd_doctor(args) -> None:
 
     # --- Hook platform compatibility (Windows) ----------------------------
     if IS_WINDOWS or strict:
+        from toolbox._jsonio import load_json
         from toolbox.global_wiring import SETTINGS_JSON
-        import json
 
         hook_compat_ok = True
         hook_compat_detail = ""
 
         if SETTINGS_JSON.exists():
             try:
-                with open(SETTINGS_JSON, encoding="utf-8") as fh:
-                    all_hooks = json.load(fh).get("hooks", {})
+                all_hooks = load_json(SETTINGS_JSON).get("hooks", {})
                 sh_only = []
                 for event, entries in all_hooks.items():
                     for entry in entries:
@@ -292,7 +338,7 @@ def cmd_doctor(args) -> None:
                 if sh_only:
                     hook_compat_ok = False
                     hook_compat_detail = ", ".join(sorted(set(sh_only)))
-            except (json.JSONDecodeError, ValueError):
+            except (OSError, ValueError):
                 pass
 
         if hook_compat_ok:
@@ -315,7 +361,7 @@ def cmd_doctor(args) -> None:
                 has_warn = True
 
     # --- Permissions ------------------------------------------------------
-    perms_state = check_global_permissions()
+    perms_state = probes["perms"]
     if perms_state["installed"]:
         checks.append((
             "Permissions",
@@ -336,7 +382,7 @@ def cmd_doctor(args) -> None:
         has_warn = True
 
     # --- CLAUDE.md block --------------------------------------------------
-    md_state = check_global_claude_md()
+    md_state = probes["claude_md"]
     if md_state["installed"]:
         checks.append(("CLAUDE.md", "~/.claude/", _OK, "toolbox block present"))
     elif md_state.get("legacy_markers"):
@@ -380,12 +426,10 @@ def cmd_doctor(args) -> None:
     # --- Print results ----------------------------------------------------
     info("Adservio Toolbox — Doctor\n")
 
-    rows = []
-    for name, value, status, note in checks:
-        mark = _check_mark(status)
-        display = f"{value}  {note}".strip() if note else value
-        rows.append((name, display, mark))
-
+    rows = (
+        (name, f"{value}  {note}".strip() if note else value, _check_mark(status))
+        for name, value, status, note in checks
+    )
     print_table(rows, headers=["Component", "Value", ""])
 
     # --- Summary ----------------------------------------------------------
@@ -14,28 +14,30 @@ Writing: all four surfaces updated so toolboxctl/memctl/Claude always agree.
 
 from __future__ import annotations
 
-import json
-import shutil
-from pathlib import Path
+import os
+import stat
+from pathlib import Path, PurePath
 
+from toolbox._jsonio import atomic_write, load_json, write_json
 from toolbox._platform import resolve_hook_command
 from toolbox.config import CONFIG_FILENAME, find_config, load_config, write_config
+from toolbox.global_wiring import _eol, _read_bytes, _scripts_path, _with_eol
 from toolbox.helpers import die, info, warn
 
 # ---------------------------------------------------------------------------
 # Sentinel helpers (memctl convention)
 # ---------------------------------------------------------------------------
 
-_ECO_DIR = ".claude/eco"
-_DISABLED_SENTINEL = ".claude/eco/.disabled"
+_ECO_DIR_REL = PurePath(".claude/eco")
+_DISABLED_REL = _ECO_DIR_REL / ".disabled"
 
 
 def _eco_dir(cwd: Path | None = None) -> Path:
-    return (cwd or Path.cwd()) / _ECO_DIR
+    return (cwd or Path.cwd()) / _ECO_DIR_REL
 
 
 def _sentinel(cwd: Path | None = None) -> Path:
-    return (cwd or Path.cwd()) / _DISABLED_SENTINEL
+    return (cwd or Path.cwd()) / _DISABLED_REL
 
 
 def _read_sentinel(cwd: Path | None = None) -> bool | None:
@@ -43,18 +45,25 @@ def _read_sentinel(cwd: Path | None = None) -> bool | None:
 
     Returns True (on), False (off), or None (eco not installed).
     """
-    eco_dir = _eco_dir(cwd)
-    if not eco_dir.is_dir():
+    base = cwd or Path.cwd()
+    # One stat in the common case: a present sentinel implies the eco dir
+    try:
+        os.stat(base / _DISABLED_REL)
+        return False
+    except OSError:
+        pass
+    try:
+        return True if stat.S_ISDIR(os.stat(base / _ECO_DIR_REL).st_mode) else None
+    except OSError:
         return None
-    return not _sentinel(cwd).exists()
 
 
 def _write_sentinel(enabled: bool, cwd: Path | None = None) -> None:
     """Sync the memctl sentinel file to match *enabled*."""
-    eco_dir = _eco_dir(cwd)
-    if not eco_dir.is_dir():
+    base = cwd or Path.cwd()
+    if not os.path.isdir(base / _ECO_DIR_REL):
         return  # eco not installed — nothing to sync
-    sentinel = _sentinel(cwd)
+    sentinel = base / _DISABLED_REL
     if enabled:
         sentinel.unlink(missing_ok=True)
     else:
@@ -75,6 +84,14 @@ _ECO_BLOCK_CONTENT = """\
 - Structure answers as: Retrieved (cite sources) then Analysis.
 """
 
+# Encoded forms: CLAUDE.md is scanned and rewritten as bytes, never decoded
+_ECO_BLOCK_BEGIN_B = _ECO_BLOCK_BEGIN.encode("utf-8")
+_ECO_BLOCK_END_B = _ECO_BLOCK_END.encode("utf-8")
+# LF-terminated; converted to the file's own line ending by _with_eol()
+_ECO_FULL_BLOCK_B = (
+    f"{_ECO_BLOCK_BEGIN}\n{_ECO_BLOCK_CONTENT}{_ECO_BLOCK_END}\n".encode("utf-8")
+)
+
 
 def _inject_eco_claude_md(cwd: Path | None = None) -> bool:
     """Inject eco behavioral block into project CLAUDE.md.
@@ -83,31 +100,38 @@ def _inject_eco_claude_md(cwd: Path | None = None) -> bool:
     """
     root = cwd or Path.cwd()
     claude_md = root / "CLAUDE.md"
-    full_block = f"{_ECO_BLOCK_BEGIN}\n{_ECO_BLOCK_CONTENT}{_ECO_BLOCK_END}\n"
 
-    if not claude_md.exists():
+    content = _read_bytes(claude_md)
+    if content is None:
         # No CLAUDE.md — skip (toolboxctl init creates it)
         warn("No CLAUDE.md found — eco block not injected. Run 'toolboxctl init' first.")
         return False
 
-    content = claude_md.read_text(encoding="utf-8")
+    eol = _eol(content)
+    full_block = _with_eol(_ECO_FULL_BLOCK_B, eol)
 
-    if _ECO_BLOCK_BEGIN in content and _ECO_BLOCK_END in content:
-        # Already present — replace in case content changed
-        before = content[: content.index(_ECO_BLOCK_BEGIN)]
-        after = content[content.index(_ECO_BLOCK_END) + len(_ECO_BLOCK_END):]
-        after = after.lstrip("\n")
-        new_content = before + full_block + after
-        if new_content == content:
+    i = content.find(_ECO_BLOCK_BEGIN_B)
+    j = content.find(_ECO_BLOCK_END_B, i + len(_ECO_BLOCK_BEGIN_B)) if i != -1 else -1
+    if j != -1:
+        # Already present and identical (bounded compare in place)
+        end = i + len(full_block)
+        if content.startswith(full_block, i) and content[end:end + 1] not in (b"\n", b"\r"):
             return False
-        claude_md.write_text(new_content, encoding="utf-8")
+        # Replace in case content changed
+        after = content[j + len(_ECO_BLOCK_END_B):].lstrip(b"\r\n")
+        new_content = content[:i] + full_block + after
+        atomic_write(claude_md, new_content)
         info("Updated eco block in CLAUDE.md.")
         return True
 
     # Append
-    separator = "\n" if content and not content.endswith("\n") else ""
-    separator += "\n" if content else ""
-    claude_md.write_text(content + separator + full_block, encoding="utf-8")
+    if not content:
+        new_content = full_block
+    elif content.endswith(b"\n"):
+        new_content = content + eol + full_block
+    else:
+        new_content = content + eol + eol + full_block
+    atomic_write(claude_md, new_content)
     info("Injected eco block into CLAUDE.md.")
     return True
 
@@ -120,27 +144,25 @@ def _remove_eco_claude_md(cwd: Path | None = None) -> bool:
     root = cwd or Path.cwd()
     claude_md = root / "CLAUDE.md"
 
-    if not claude_md.exists():
+    content = _read_bytes(claude_md)
+    if content is None:
         return False
 
-    content = claude_md.read_text(encoding="utf-8")
-
-    if _ECO_BLOCK_BEGIN not in content:
+    before, found, rest = content.partition(_ECO_BLOCK_BEGIN_B)
+    if not found:
         return False
 
-    if _ECO_BLOCK_END not in content:
+    _, found, after = rest.partition(_ECO_BLOCK_END_B)
+    if not found:
         warn("Found ECO BEGIN marker but no END marker in CLAUDE.md — skipping.")
         return False
 
-    before = content[: content.index(_ECO_BLOCK_BEGIN)]
-    after = content[content.index(_ECO_BLOCK_END) + len(_ECO_BLOCK_END):]
-
     # Clean up trailing blank lines
-    new_content = before.rstrip("\n") + "\n" + after.lstrip("\n")
+    new_content = before.rstrip(b"\r\n") + _eol(content) + after.lstrip(b"\r\n")
     if not new_content.strip():
-        new_content = ""
+        new_content = b""
 
-    claude_md.write_text(new_content, encoding="utf-8")
+    atomic_write(claude_md, new_content)
     info("Removed eco block from CLAUDE.md.")
     return True
 
@@ -159,25 +181,22 @@ def _find_eco_nudge_script() -> str | None:
     On Windows, prefers the .py entrypoint if available; on POSIX returns the
     .sh script.  Uses :func:`resolve_hook_command` for OS-aware selection.
     """
-    memctl_bin = shutil.which("memctl")
-    if not memctl_bin:
-        return None
-
-    import subprocess
-    result = subprocess.run(
-        [memctl_bin, "scripts-path"],
-        capture_output=True, text=True, timeout=10,
-    )
-    if result.returncode != 0:
+    scripts_path = _scripts_path("memctl")
+    if scripts_path is None:
         return None
 
-    scripts_dir = Path(result.stdout.strip())
+    scripts_dir = Path(scripts_path)
     nudge_sh = scripts_dir.parent / "templates" / "hooks" / "eco-nudge.sh"
     if nudge_sh.exists():
         return resolve_hook_command(str(nudge_sh.resolve()))
     return None
 
 
+def _nudge_hooks(nudge_path: str) -> list[dict]:
+    """Return the ``hooks`` list of the eco-nudge PreToolUse entry."""
+    return [{"type": "command", "command": nudge_path, "timeout": 10000}]
+
+
 def _install_eco_nudge_hook() -> bool:
     """Register eco-nudge.sh as a global PreToolUse hook.
 
@@ -188,14 +207,12 @@ def _install_eco_nudge_hook() -> bool:
         warn("eco-nudge.sh not found in memctl. Upgrade memctl: pipx upgrade memctl")
         return False
 
-    if not _GLOBAL_SETTINGS.exists():
+    try:
+        settings = load_json(_GLOBAL_SETTINGS)
+    except FileNotFoundError:
         warn(f"{_GLOBAL_SETTINGS} not found — cannot register eco-nudge hook.")
         return False
-
-    try:
-        with open(_GLOBAL_SETTINGS, encoding="utf-8") as fh:
-            settings = json.load(fh)
-    except (json.JSONDecodeError, ValueError):
+    except ValueError:
         warn(f"Could not parse {_GLOBAL_SETTINGS} — skipping eco-nudge hook.")
         return False
 
@@ -210,24 +227,20 @@ def _install_eco_nudge_hook() -> bool:
             if hook_list and hook_list[0].get("command") == nudge_path:
                 return False
             # Path changed — update
-            entry["hooks"] = [{"type": "command", "command": nudge_path, "timeout": 10000}]
-            with open(_GLOBAL_SETTINGS, "w", encoding="utf-8") as fh:
-                json.dump(settings, fh, indent=2, ensure_ascii=False)
-                fh.write("\n")
+            entry["hooks"] = _nudge_hooks(nudge_path)
+            write_json(_GLOBAL_SETTINGS, settings)
             info("Updated eco-nudge hook path in global settings.")
             return True
 
     # Not yet registered — append
     entry = {
-        "hooks": [{"type": "command", "command": nudge_path, "timeout": 10000}],
+        "hooks": _nudge_hooks(nudge_path),
         "_source": _HOOK_SOURCE_TAG,
         "matcher": "Grep|Glob",
     }
     pre_tool.append(entry)
 
-    with open(_GLOBAL_SETTINGS, "w", encoding="utf-8") as fh:
-        json.dump(settings, fh, indent=2, ensure_ascii=False)
-        fh.write("\n")
+    write_json(_GLOBAL_SETTINGS, settings)
     info(f"Registered eco-nudge hook (PreToolUse Grep|Glob) in {_GLOBAL_SETTINGS}")
     return True
 
@@ -237,13 +250,9 @@ def _uninstall_eco_nudge_hook() -> bool:
 
     Returns True if changes were made.
     """
-    if not _GLOBAL_SETTINGS.exists():
-        return False
-
     try:
-        with open(_GLOBAL_SETTINGS, encoding="utf-8") as fh:
-            settings = json.load(fh)
-    except (json.JSONDecodeError, ValueError):
+        settings = load_json(_GLOBAL_SETTINGS)
+    except (FileNotFoundError, ValueError):
         return False
 
     hooks = settings.get("hooks", {})
@@ -262,9 +271,7 @@ def _uninstall_eco_nudge_hook() -> bool:
     if not filtered:
         del hooks["PreToolUse"]
 
-    with open(_GLOBAL_SETTINGS, "w", encoding="utf-8") as fh:
-        json.dump(settings, fh, indent=2, ensure_ascii=False)
-        fh.write("\n")
+    write_json(_GLOBAL_SETTINGS, settings)
     info("Removed eco-nudge hook from global settings.")
     return True
 
@@ -277,11 +284,12 @@ def _uninstall_eco_nudge_hook() -> bool:
 def cmd_eco(args) -> None:
     """Entry point for ``toolboxctl eco [on|off]``."""
     action: str | None = getattr(args, "action", None)
-    config_path = find_config()
+    cwd = Path.cwd()
+    config_path = find_config(cwd)
     cfg = load_config(config_path)
 
     # Read state: sentinel wins when eco dir exists, config is fallback
-    sentinel_state = _read_sentinel()
+    sentinel_state = _read_sentinel(cwd)
     if sentinel_state is not None:
         current = sentinel_state
     else:
@@ -292,7 +300,7 @@ def cmd_eco(args) -> None:
         state = "on" if current else "off"
         info(f"Eco mode is currently: {state}")
         if sentinel_state is not None:
-            info(f"Source: {_eco_dir()} (memctl sentinel)")
+            info(f"Source: {_eco_dir(cwd)} (memctl sentinel)")
         if config_path:
             info(f"Config: {config_path}")
         else:
@@ -313,13 +321,13 @@ def cmd_eco(args) -> None:
     write_config(cfg, config_path)
 
     # Sync sentinel so memctl sees the same state
-    _write_sentinel(new_state)
+    _write_sentinel(new_state, cwd)
 
     # F-T1: inject/remove eco block in CLAUDE.md
     if new_state:
-        _inject_eco_claude_md()
+        _inject_eco_claude_md(cwd)
     else:
-        _remove_eco_claude_md()
+        _remove_eco_claude_md(cwd)
 
     # F-T2: register/unregister eco-nudge PreToolUse hook (global)
     if new_state:
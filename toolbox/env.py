@@ -7,8 +7,6 @@ Usage:
 
 from __future__ import annotations
 
-import json
-import shlex
 import sys
 
 from toolbox.config import config_to_env, load_config
@@ -27,12 +25,18 @@ def cmd_env(args) -> None:
     env_map = config_to_env(cfg)
 
     if as_json:
+        import json
+
         # stdout — machine-readable
         print(json.dumps(env_map, indent=2))
     else:
-        # stdout — sourceable shell exports
-        for key, value in sorted(env_map.items()):
-            print(f"export {key}={shlex.quote(value)}")
+        import shlex
+
+        # stdout — sourceable shell exports, emitted in a single write
+        sys.stdout.write("".join(
+            f"export {key}={shlex.quote(value)}\n"
+            for key, value in sorted(env_map.items())
+        ))
         # Only show the hint when stdout is a TTY (not piped into eval)
         if sys.stdout.isatty():
             info("Paste or eval the lines above to inject into your shell.")
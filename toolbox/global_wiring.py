@@ -10,12 +10,22 @@ All operations are idempotent and reversible.
 
 from __future__ import annotations
 
-import json
-import shutil
+import functools
+import os
 from pathlib import Path
-
+from typing import Any
+
+from toolbox._cache import CACHE_DIR
+from toolbox._jsonio import (
+    atomic_write,
+    dumps,
+    loads,
+    read_json,
+    read_json_if_contains,
+    write_json,
+)
 from toolbox._platform import resolve_hook_command
-from toolbox.helpers import error, info, run, warn
+from toolbox.helpers import error, info, warn
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -41,8 +51,24 @@ _STALE_PERMISSIONS = [
     "Bash(toolboxctl *)",
 ]
 
+# Membership views of the lists above (order matters only when appending)
+_GLOBAL_PERMISSIONS_SET = frozenset(GLOBAL_PERMISSIONS)
+_STALE_PERMISSIONS_SET = frozenset(_STALE_PERMISSIONS)
+_MANAGED_PERMISSIONS_SET = _GLOBAL_PERMISSIONS_SET | _STALE_PERMISSIONS_SET
+
 # Marker used to identify toolbox-managed hook entries
 HOOK_SOURCE_TAG = "adservio-toolbox"
+_HOOK_SOURCE_NEEDLE = f'"{HOOK_SOURCE_TAG}"'.encode()  # raw-file probe
+
+# Secrets-only hook profile: event → (CloakMCP script, timeout ms, matcher)
+_TOOLBOX_HOOKS: dict[str, tuple[str, int, str | None]] = {
+    "SessionStart": ("cloak-session-start.sh", 60000, "startup"),
+    "SessionEnd": ("cloak-session-end.sh", 60000, None),
+    "UserPromptSubmit": ("cloak-prompt-guard.sh", 10000, None),
+    "PreToolUse": ("cloak-guard-write.sh", 10000, "Write|Edit"),
+    "PostToolUse": ("cloak-audit-logger.sh", 5000, "Write|Edit|Bash"),
+}
+_HOOK_EVENTS = frozenset(_TOOLBOX_HOOKS)
 
 # Delimiters for the managed block in ~/.claude/CLAUDE.md
 _BLOCK_BEGIN = "<!-- ADSERVIO_TOOLBOX GLOBAL BEGIN — managed by toolboxctl, do not edit manually -->"
@@ -66,41 +92,120 @@ _CLAUDE_MD_BLOCK = """\
 - Run `toolboxctl doctor` to verify the toolbox installation at any time.
 """
 
+# Encoded forms: CLAUDE.md is scanned and rewritten as bytes, never decoded
+_BLOCK_BEGIN_B = _BLOCK_BEGIN.encode("utf-8")
+_BLOCK_END_B = _BLOCK_END.encode("utf-8")
+_LEGACY_BLOCK_BEGIN_B = _LEGACY_BLOCK_BEGIN.encode("utf-8")
+_LEGACY_BLOCK_END_B = _LEGACY_BLOCK_END.encode("utf-8")
+# LF-terminated; converted to the file's own line ending by _with_eol()
+_FULL_BLOCK_B = f"{_BLOCK_BEGIN}\n{_CLAUDE_MD_BLOCK}{_BLOCK_END}\n".encode("utf-8")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _read_json(path: Path) -> dict:
-    """Read a JSON file, returning {} if it doesn't exist or is empty."""
-    if not path.exists():
-        return {}
+def _read_bytes(path: Path) -> bytes | None:
+    """Read a file's raw bytes, or return None if it does not exist.
+
+    Replaces an ``exists()`` pre-check: one ``open`` instead of two syscalls.
+    """
     try:
-        with open(path, encoding="utf-8") as fh:
-            return json.load(fh)
-    except (json.JSONDecodeError, ValueError):
-        warn(f"Could not parse {path} — treating as empty.")
-        return {}
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
 
 
-def _write_json(path: Path, data: dict) -> None:
-    """Write a JSON file with consistent formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2)
-        fh.write("\n")
+def _eol(content: bytes | None) -> bytes:
+    """Line ending used by *content* (CRLF or LF), else the platform's.
 
+    Byte-level edits must keep a CRLF file CRLF: text-mode I/O used to
+    normalize this, raw bytes do not.
+    """
+    nl = content.find(b"\n") if content else -1
+    if nl == -1:
+        return os.linesep.encode("ascii")
+    return b"\r\n" if content[nl - 1:nl] == b"\r" else b"\n"
 
-def _cloak_scripts_path() -> Path | None:
-    """Return the CloakMCP scripts directory, or None if unavailable."""
-    cloak = shutil.which("cloak")
-    if not cloak:
+
+@functools.cache
+def _with_eol(block: bytes, eol: bytes) -> bytes:
+    """Return LF-terminated *block* with its line endings set to *eol*."""
+    return block if eol == b"\n" else block.replace(b"\n", eol)
+
+
+def _preload() -> tuple[dict, dict, bytes | None]:
+    """Read settings.local.json, settings.json and CLAUDE.md once, up front."""
+    return read_json(SETTINGS_LOCAL_JSON), read_json(SETTINGS_JSON), _read_bytes(CLAUDE_MD)
+
+
+# Marks an optional pre-loaded argument that the caller did not supply
+_NOT_LOADED: Any = object()
+
+
+# Resolved ``<tool> scripts-path`` answers, persisted across CLI runs
+_PATHS_CACHE = CACHE_DIR / "paths.json"
+
+
+def _scripts_path(tool: str) -> str | None:
+    """Return the output of ``<tool> scripts-path``, or None if unavailable.
+
+    Spawning the tool costs a Python interpreter start-up, so answers are
+    memoized per process and persisted to ``_PATHS_CACHE``; both are keyed
+    on the binary's path and mtime, so upgrading the tool invalidates them.
+    """
+    import shutil
+
+    binary = shutil.which(tool)
+    if not binary:
+        return None
+    try:
+        mtime_ns = os.stat(binary).st_mtime_ns
+    except OSError:
+        return None
+    return _scripts_path_cached(binary, mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _scripts_path_cached(binary: str, mtime_ns: int) -> str | None:
+    try:
+        known = loads(_PATHS_CACHE.read_bytes())
+    except (OSError, ValueError):
+        known = {}
+    hit = known.get(binary)
+    if (isinstance(hit, dict) and hit.get("mtime_ns") == mtime_ns
+            and isinstance(hit.get("path"), str) and os.path.isdir(hit["path"])):
+        return hit["path"]
+
+    import subprocess
+    try:
+        # Bytes out, stderr discarded: the answer is a single local path
+        result = subprocess.run(
+            [binary, "scripts-path"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
         return None
-    result = run(["cloak", "scripts-path"], check=False, quiet=True)
     if result.returncode != 0:
         return None
-    scripts = Path(result.stdout.strip())
+    path = os.fsdecode(result.stdout).strip()
+
+    known[binary] = {"mtime_ns": mtime_ns, "path": path}
+    try:
+        _PATHS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _PATHS_CACHE.write_bytes(dumps(known))
+    except OSError:
+        pass  # cache is best-effort
+    return path
+
+
+def _cloak_scripts_path() -> Path | None:
+    """Return the CloakMCP scripts directory, or None if unavailable."""
+    path = _scripts_path("cloak")
+    if path is None:
+        return None
+    scripts = Path(path)
     if scripts.is_dir():
         return scripts
     return None
@@ -111,34 +216,31 @@ def _cloak_scripts_path() -> Path | None:
 # ---------------------------------------------------------------------------
 
 
-def install_global_permissions() -> bool:
+def install_global_permissions(settings: dict | None = None) -> bool:
     """Inject cloak/memctl/toolboxctl Bash permissions into settings.local.json.
 
     Also removes stale space-glob entries (``Bash(cmd *)``) left by older
     versions and replaces them with colon-glob format (``Bash(cmd:*)``).
+    *settings* may be passed pre-loaded (see :func:`install_global`).
 
     Returns True if changes were made.
     """
-    settings = _read_json(SETTINGS_LOCAL_JSON)
+    if settings is None:
+        settings = read_json(SETTINGS_LOCAL_JSON)
     allow = settings.setdefault("permissions", {}).setdefault("allow", [])
 
-    changed = False
-
     # Remove stale space-glob entries from older toolbox versions
-    for stale in _STALE_PERMISSIONS:
-        if stale in allow:
-            allow.remove(stale)
-            changed = True
+    changed = not _STALE_PERMISSIONS_SET.isdisjoint(allow)
+    if changed:
+        allow[:] = [p for p in allow if p not in _STALE_PERMISSIONS_SET]
 
     # Add current permissions
-    added = []
-    for perm in GLOBAL_PERMISSIONS:
-        if perm not in allow:
-            allow.append(perm)
-            added.append(perm)
+    existing = set(allow)
+    added = [p for p in GLOBAL_PERMISSIONS if p not in existing]
+    allow.extend(added)
 
     if added or changed:
-        _write_json(SETTINGS_LOCAL_JSON, settings)
+        write_json(SETTINGS_LOCAL_JSON, settings)
         for perm in added:
             info(f"Global permission added: {perm}")
         if changed and not added:
@@ -149,29 +251,23 @@ def install_global_permissions() -> bool:
     return False
 
 
-def uninstall_global_permissions() -> bool:
+def uninstall_global_permissions(settings: dict | None = None) -> bool:
     """Remove toolbox-managed permissions from ~/.claude/settings.local.json.
 
     Removes both current (colon-glob) and stale (space-glob) entries.
+    *settings* may be passed pre-loaded (see :func:`uninstall_global`).
     Returns True if changes were made.
     """
-    if not SETTINGS_LOCAL_JSON.exists():
-        return False
-
-    settings = _read_json(SETTINGS_LOCAL_JSON)
+    if settings is None:
+        settings = read_json(SETTINGS_LOCAL_JSON)
     allow = settings.get("permissions", {}).get("allow", [])
-    if not allow:
+    if not allow or _MANAGED_PERMISSIONS_SET.isdisjoint(allow):
         return False
 
-    remove_set = set(GLOBAL_PERMISSIONS) | set(_STALE_PERMISSIONS)
-    original_len = len(allow)
-    filtered = [p for p in allow if p not in remove_set]
-
-    if len(filtered) == original_len:
-        return False
+    filtered = [p for p in allow if p not in _MANAGED_PERMISSIONS_SET]
 
     settings["permissions"]["allow"] = filtered
-    _write_json(SETTINGS_LOCAL_JSON, settings)
+    write_json(SETTINGS_LOCAL_JSON, settings)
     for perm in GLOBAL_PERMISSIONS:
         if perm not in filtered:
             info(f"Global permission removed: {perm}")
@@ -195,11 +291,12 @@ def _build_hook_entry(command: str, timeout: int | None = None,
     return group
 
 
-def install_global_hooks() -> bool:
+def install_global_hooks(settings: dict | None = None) -> bool:
     """Install CloakMCP secrets-only hooks into ~/.claude/settings.json.
 
     Uses absolute paths to hook scripts from the CloakMCP package.
     Merges into existing hooks (does not replace).
+    *settings* may be passed pre-loaded (see :func:`install_global`).
     Returns True if changes were made.
     """
     scripts = _cloak_scripts_path()
@@ -213,6 +310,22 @@ def install_global_hooks() -> bool:
         # Fallback: scripts may be flat (older CloakMCP)
         hooks_dir = scripts
 
+    if settings is None:
+        settings = read_json(SETTINGS_JSON)
+
+    # Steady state: every event already carries a toolbox entry
+    have = {
+        event
+        for event, event_list in settings.get("hooks", {}).items()
+        if isinstance(event_list, list) and any(
+            isinstance(e, dict) and e.get("_source") == HOOK_SOURCE_TAG
+            for e in event_list
+        )
+    }
+    if have >= _HOOK_EVENTS:
+        info("Global CloakMCP hooks already configured.")
+        return False
+
     # Resolve absolute paths to hook scripts (OS-aware)
     def _hook(name: str) -> str:
         for candidate in [hooks_dir / name, scripts / name]:
@@ -223,45 +336,30 @@ def install_global_hooks() -> bool:
 
     # secrets-only profile: 5 hooks
     toolbox_hooks = {
-        "SessionStart": [
-            _build_hook_entry(_hook("cloak-session-start.sh"), timeout=60000,
-                              matcher="startup"),
-        ],
-        "SessionEnd": [
-            _build_hook_entry(_hook("cloak-session-end.sh"), timeout=60000),
-        ],
-        "UserPromptSubmit": [
-            _build_hook_entry(_hook("cloak-prompt-guard.sh"), timeout=10000),
-        ],
-        "PreToolUse": [
-            _build_hook_entry(_hook("cloak-guard-write.sh"), timeout=10000,
-                              matcher="Write|Edit"),
-        ],
-        "PostToolUse": [
-            _build_hook_entry(_hook("cloak-audit-logger.sh"), timeout=5000,
-                              matcher="Write|Edit|Bash"),
-        ],
+        event: [_build_hook_entry(_hook(script), timeout=timeout, matcher=matcher)]
+        for event, (script, timeout, matcher) in _TOOLBOX_HOOKS.items()
     }
 
-    settings = _read_json(SETTINGS_JSON)
     existing_hooks = settings.setdefault("hooks", {})
 
     changed = False
     for event, entries in toolbox_hooks.items():
-        event_list = existing_hooks.setdefault(event, [])
+        event_list = existing_hooks.get(event)
+        if event_list is None:
+            existing_hooks[event] = entries
+            changed = True
+            continue
 
         # Check if our hooks are already present (by _source tag)
-        existing_sources = {
-            e.get("_source") for e in event_list if isinstance(e, dict)
-        }
-        if HOOK_SOURCE_TAG in existing_sources:
+        if any(isinstance(e, dict) and e.get("_source") == HOOK_SOURCE_TAG
+               for e in event_list):
             continue
 
         event_list.extend(entries)
         changed = True
 
     if changed:
-        _write_json(SETTINGS_JSON, settings)
+        write_json(SETTINGS_JSON, settings)
         info("Global CloakMCP hooks installed (secrets-only profile).")
         return True
 
@@ -269,16 +367,17 @@ def install_global_hooks() -> bool:
     return False
 
 
-def uninstall_global_hooks() -> bool:
+def uninstall_global_hooks(settings: dict | None = None) -> bool:
     """Remove toolbox-managed hooks from ~/.claude/settings.json.
 
     Removes only entries with ``"_source": "adservio-toolbox"``.
+    *settings* may be passed pre-loaded (see :func:`uninstall_global`).
     Returns True if changes were made.
     """
-    if not SETTINGS_JSON.exists():
-        return False
-
-    settings = _read_json(SETTINGS_JSON)
+    if settings is None:
+        settings = read_json_if_contains(SETTINGS_JSON, _HOOK_SOURCE_NEEDLE)
+        if settings is None:
+            return False  # missing, or no toolbox entry anywhere in the file
     hooks = settings.get("hooks")
     if not hooks:
         return False
@@ -301,7 +400,7 @@ def uninstall_global_hooks() -> bool:
         del settings["hooks"]
 
     if changed:
-        _write_json(SETTINGS_JSON, settings)
+        write_json(SETTINGS_JSON, settings)
         info("Global CloakMCP hooks removed.")
         return True
 
@@ -316,15 +415,17 @@ def uninstall_global_hooks() -> bool:
 def check_legacy_global_markers() -> dict:
     """Detect pre-doctrine (legacy) markers in ~/.claude/CLAUDE.md."""
     result = {"has_legacy": False, "has_new": False}
-    if not CLAUDE_MD.exists():
+    content = _read_bytes(CLAUDE_MD)
+    if content is None:
         return result
-    content = CLAUDE_MD.read_text(encoding="utf-8")
-    result["has_legacy"] = _LEGACY_BLOCK_BEGIN in content and _LEGACY_BLOCK_END in content
-    result["has_new"] = _BLOCK_BEGIN in content and _BLOCK_END in content
+    result["has_legacy"] = (
+        _LEGACY_BLOCK_BEGIN_B in content and _LEGACY_BLOCK_END_B in content
+    )
+    result["has_new"] = _BLOCK_BEGIN_B in content and _BLOCK_END_B in content
     return result
 
 
-def install_global_claude_md() -> bool:
+def install_global_claude_md(content: bytes | None = _NOT_LOADED) -> bool:
     """Write or update the toolbox block in ~/.claude/CLAUDE.md.
 
     - Creates the file if missing.
@@ -332,86 +433,101 @@ def install_global_claude_md() -> bool:
     - Updates the block in-place if markers already exist.
     - Warns if legacy (pre-doctrine) markers are found without new markers.
 
+    *content* may be passed pre-loaded (None meaning the file is missing).
     Returns True if changes were made.
     """
-    full_block = f"{_BLOCK_BEGIN}\n{_CLAUDE_MD_BLOCK}{_BLOCK_END}\n"
+    if content is _NOT_LOADED:
+        content = _read_bytes(CLAUDE_MD)
+
+    eol = _eol(content)
+    full_block = _with_eol(_FULL_BLOCK_B, eol)
 
-    if not CLAUDE_MD.exists():
+    if content is None:
         CLAUDE_MD.parent.mkdir(parents=True, exist_ok=True)
-        CLAUDE_MD.write_text(full_block, encoding="utf-8")
+        atomic_write(CLAUDE_MD, full_block)
         info(f"Created {CLAUDE_MD} with toolbox conventions.")
         return True
 
-    content = CLAUDE_MD.read_text(encoding="utf-8")
+    i = content.find(_BLOCK_BEGIN_B)
+    j = content.find(_BLOCK_END_B, i + len(_BLOCK_BEGIN_B)) if i != -1 else -1
+    has_new = j != -1
 
     # Detect legacy markers
-    has_legacy = _LEGACY_BLOCK_BEGIN in content and _LEGACY_BLOCK_END in content
-    has_new = _BLOCK_BEGIN in content and _BLOCK_END in content
-
-    if has_legacy and not has_new:
-        warn("Legacy (pre-doctrine) toolbox markers found in CLAUDE.md.")
-        warn("Run 'toolboxctl update --global' after removing the old block,")
-        warn("or manually delete the old block between the legacy markers.")
-        return False
+    if not has_new:
+        li = content.find(_LEGACY_BLOCK_BEGIN_B)
+        if li != -1 and content.find(_LEGACY_BLOCK_END_B, li) != -1:
+            warn("Legacy (pre-doctrine) toolbox markers found in CLAUDE.md.")
+            warn("Run 'toolboxctl update --global' after removing the old block,")
+            warn("or manually delete the old block between the legacy markers.")
+            return False
 
     if has_new:
-        # Replace existing block
-        before = content[: content.index(_BLOCK_BEGIN)]
-        after = content[content.index(_BLOCK_END) + len(_BLOCK_END) :]
-        # Strip trailing newline from after to avoid double newlines
-        after = after.lstrip("\n")
-        new_content = before + full_block + after
-        if new_content == content:
+        # Up to date iff the file holds the exact block followed by a single
+        # newline: a bounded compare in place, whatever the file size
+        end = i + len(full_block)
+        if content.startswith(full_block, i) and content[end:end + 1] not in (b"\n", b"\r"):
             info("CLAUDE.md toolbox block already up to date.")
             return False
-        CLAUDE_MD.write_text(new_content, encoding="utf-8")
+        # Replace existing block
+        # Strip leading newlines from after to avoid double newlines
+        after = content[j + len(_BLOCK_END_B) :].lstrip(b"\r\n")
+        new_content = content[:i] + full_block + after
+        atomic_write(CLAUDE_MD, new_content)
         info("Updated toolbox block in CLAUDE.md.")
         return True
 
     # Append block
-    separator = "\n" if content and not content.endswith("\n") else ""
-    separator += "\n" if content else ""
-    CLAUDE_MD.write_text(content + separator + full_block, encoding="utf-8")
+    if not content:
+        new_content = full_block
+    elif content.endswith(b"\n"):
+        new_content = content + eol + full_block
+    else:
+        new_content = content + eol + eol + full_block
+    atomic_write(CLAUDE_MD, new_content)
     info(f"Appended toolbox block to {CLAUDE_MD}.")
     return True
 
 
-def uninstall_global_claude_md() -> bool:
+def uninstall_global_claude_md(content: bytes | None = _NOT_LOADED) -> bool:
     """Remove the toolbox block from ~/.claude/CLAUDE.md.
 
     Handles both new (doctrine) and legacy (pre-doctrine) marker sets.
+    *content* may be passed pre-loaded (None meaning the file is missing).
     Returns True if changes were made.
     """
-    if not CLAUDE_MD.exists():
+    if content is _NOT_LOADED:
+        content = _read_bytes(CLAUDE_MD)
+    if content is None:
         return False
 
-    content = CLAUDE_MD.read_text(encoding="utf-8")
+    eol = _eol(content)
     changed = False
 
     # Try new markers first, then legacy
     for begin, end in [
-        (_BLOCK_BEGIN, _BLOCK_END),
-        (_LEGACY_BLOCK_BEGIN, _LEGACY_BLOCK_END),
+        (_BLOCK_BEGIN_B, _BLOCK_END_B),
+        (_LEGACY_BLOCK_BEGIN_B, _LEGACY_BLOCK_END_B),
     ]:
-        if begin not in content:
+        before, found, rest = content.partition(begin)
+        if not found:
             continue
-        if end not in content:
+        _, found, after = rest.partition(end)
+        if not found:
             warn(f"Found BEGIN marker but no END marker in {CLAUDE_MD} — skipping.")
             continue
 
-        before = content[: content.index(begin)]
-        after = content[content.index(end) + len(end) :]
-
         # Clean up extra blank lines around the removed block
-        content = before.rstrip("\n") + after.lstrip("\n")
-        if content and not content.endswith("\n"):
-            content += "\n"
+        before = before.rstrip(b"\r\n")
+        after = after.lstrip(b"\r\n")
+        content = before + eol + after if before and after else before + after
+        if content and not content.endswith(b"\n"):
+            content += eol
         if not content.strip():
-            content = ""
+            content = b""
         changed = True
 
     if changed:
-        CLAUDE_MD.write_text(content, encoding="utf-8")
+        atomic_write(CLAUDE_MD, content)
         info("Removed toolbox block from CLAUDE.md.")
 
     return changed
@@ -425,19 +541,21 @@ def uninstall_global_claude_md() -> bool:
 def install_global(args=None) -> None:
     """Full global wiring: permissions + hooks + CLAUDE.md."""
     info("Installing global Claude Code wiring …")
-    install_global_permissions()
-    install_global_hooks()
-    install_global_claude_md()
+    local_settings, settings, claude_md = _preload()
+    install_global_permissions(local_settings)
+    install_global_hooks(settings)
+    install_global_claude_md(claude_md)
     info("Global install complete. Run 'toolboxctl doctor' to verify.")
 
 
 def uninstall_global(args=None) -> None:
     """Reverse all global wiring."""
     info("Removing global Claude Code wiring …")
+    local_settings, settings, claude_md = _preload()
     removed = False
-    removed |= uninstall_global_hooks()
-    removed |= uninstall_global_permissions()
-    removed |= uninstall_global_claude_md()
+    removed |= uninstall_global_hooks(settings)
+    removed |= uninstall_global_permissions(local_settings)
+    removed |= uninstall_global_claude_md(claude_md)
     if removed:
         info("Global uninstall complete.")
     else:
@@ -449,13 +567,37 @@ def uninstall_global(args=None) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Last check_global_hooks() scan, keyed on settings.json (mtime_ns, size)
+_HOOK_STATE: dict[tuple[int, int], tuple[int, list[str]]] = {}
+
+
 def check_global_hooks() -> dict:
     """Return a dict describing the state of global hooks."""
     result = {"installed": False, "hook_count": 0, "events": []}
-    if not SETTINGS_JSON.exists():
+    try:
+        st = SETTINGS_JSON.stat()
+    except FileNotFoundError:
         return result
 
-    settings = _read_json(SETTINGS_JSON)
+    stamp = (st.st_mtime_ns, st.st_size)
+    state = _HOOK_STATE.get(stamp)
+    if state is None:
+        state = _scan_global_hooks()
+        _HOOK_STATE.clear()
+        _HOOK_STATE[stamp] = state
+
+    count, events = state
+    result["installed"] = count > 0
+    result["hook_count"] = count
+    result["events"] = list(events)
+    return result
+
+
+def _scan_global_hooks() -> tuple[int, list[str]]:
+    """Count toolbox hook entries in settings.json and list their events."""
+    settings = read_json_if_contains(SETTINGS_JSON, _HOOK_SOURCE_NEEDLE)
+    if settings is None:
+        return 0, []  # no toolbox tag anywhere in the file: skip the parse
     hooks = settings.get("hooks", {})
 
     count = 0
@@ -465,40 +607,33 @@ def check_global_hooks() -> dict:
             if isinstance(e, dict) and e.get("_source") == HOOK_SOURCE_TAG:
                 count += 1
                 events.append(event)
-
-    result["installed"] = count > 0
-    result["hook_count"] = count
-    result["events"] = sorted(set(events))
-    return result
+    return count, sorted(set(events))
 
 
 def check_global_permissions() -> dict:
     """Return a dict describing the state of global permissions."""
     result = {"installed": False, "permissions": [], "needs_upgrade": False}
-    if not SETTINGS_LOCAL_JSON.exists():
-        return result
-
-    settings = _read_json(SETTINGS_LOCAL_JSON)
+    settings = read_json(SETTINGS_LOCAL_JSON)
     allow = settings.get("permissions", {}).get("allow", [])
 
-    found = [p for p in GLOBAL_PERMISSIONS if p in allow]
-    stale = [p for p in _STALE_PERMISSIONS if p in allow]
+    existing = set(allow)
+    found = [p for p in GLOBAL_PERMISSIONS if p in existing]
     result["installed"] = len(found) == len(GLOBAL_PERMISSIONS)
     result["permissions"] = found
-    result["needs_upgrade"] = bool(stale)
+    result["needs_upgrade"] = not _STALE_PERMISSIONS_SET.isdisjoint(existing)
     return result
 
 
 def check_global_claude_md() -> dict:
     """Return a dict describing the state of the CLAUDE.md block."""
     result = {"installed": False, "file_exists": False, "legacy_markers": False}
-    if not CLAUDE_MD.exists():
+    content = _read_bytes(CLAUDE_MD)
+    if content is None:
         return result
 
     result["file_exists"] = True
-    content = CLAUDE_MD.read_text(encoding="utf-8")
-    result["installed"] = _BLOCK_BEGIN in content and _BLOCK_END in content
+    result["installed"] = _BLOCK_BEGIN_B in content and _BLOCK_END_B in content
     result["legacy_markers"] = (
-        _LEGACY_BLOCK_BEGIN in content and _LEGACY_BLOCK_END in content
+        _LEGACY_BLOCK_BEGIN_B in content and _LEGACY_BLOCK_END_B in content
     )
     return result
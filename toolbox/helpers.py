@@ -10,7 +10,8 @@ from __future__ import annotations
 
 import subprocess
 import sys
-from typing import Any, Sequence
+from itertools import zip_longest
+from typing import Any, Iterable, Literal, Sequence
 
 # ---------------------------------------------------------------------------
 # ANSI helpers
@@ -19,30 +20,43 @@ from typing import Any, Sequence
 _USE_COLOR = sys.stderr.isatty()
 
 
-def _sgr(code: str, text: str) -> str:
-    if _USE_COLOR:
+if _USE_COLOR:
+
+    def _sgr(code: str, text: str) -> str:
         return f"\033[{code}m{text}\033[0m"
-    return text
 
+    def _bold(text: str) -> str:
+        return f"\033[1m{text}\033[0m"
+
+    def _green(text: str) -> str:
+        return f"\033[32m{text}\033[0m"
 
-def _bold(text: str) -> str:
-    return _sgr("1", text)
+    def _yellow(text: str) -> str:
+        return f"\033[33m{text}\033[0m"
 
+    def _red(text: str) -> str:
+        return f"\033[31m{text}\033[0m"
 
-def _green(text: str) -> str:
-    return _sgr("32", text)
+    def _cyan(text: str) -> str:
+        return f"\033[36m{text}\033[0m"
 
+else:
+    # No TTY (CI, pipes, hooks): colour helpers are plain pass-throughs
 
-def _yellow(text: str) -> str:
-    return _sgr("33", text)
+    def _sgr(code: str, text: str) -> str:
+        return text
 
+    def _plain(text: str) -> str:
+        return text
 
-def _red(text: str) -> str:
-    return _sgr("31", text)
+    _bold = _green = _yellow = _red = _cyan = _plain
 
 
-def _cyan(text: str) -> str:
-    return _sgr("36", text)
+# Message prefixes, coloured once (colour use is fixed at import)
+_SIGIL_INFO = _green("•")
+_SIGIL_WARN = _yellow("!")
+_SIGIL_ERROR = _red("✗")
+_SIGIL_ASK = _yellow("?")
 
 
 # ---------------------------------------------------------------------------
@@ -52,17 +66,17 @@ def _cyan(text: str) -> str:
 
 def info(msg: str) -> None:
     """Print an informational message to stderr."""
-    print(f"{_green('•')} {msg}", file=sys.stderr)
+    sys.stderr.write(f"{_SIGIL_INFO} {msg}\n")
 
 
 def warn(msg: str) -> None:
     """Print a warning message to stderr."""
-    print(f"{_yellow('!')} {msg}", file=sys.stderr)
+    sys.stderr.write(f"{_SIGIL_WARN} {msg}\n")
 
 
 def error(msg: str) -> None:
     """Print an error message to stderr."""
-    print(f"{_red('✗')} {msg}", file=sys.stderr)
+    sys.stderr.write(f"{_SIGIL_ERROR} {msg}\n")
 
 
 def die(msg: str, code: int = 1) -> None:
@@ -79,7 +93,7 @@ def die(msg: str, code: int = 1) -> None:
 def run(
     cmd: Sequence[str],
     *,
-    capture: bool = True,
+    capture: bool | Literal["stderr"] = True,
     check: bool = True,
     quiet: bool = False,
     cwd: str | None = None,
@@ -90,8 +104,10 @@ def run(
     ----------
     cmd : sequence of str
         Command and arguments.
-    capture : bool
-        Capture stdout/stderr (default True).
+    capture : bool or "stderr"
+        Capture stdout/stderr (default True).  ``"stderr"`` captures only
+        stderr and discards stdout, sparing a pipe and its decoding when
+        the caller only reports errors.
     check : bool
         Raise on non-zero exit (default True).
     quiet : bool
@@ -101,6 +117,15 @@ def run(
     """
     if not quiet:
         info(f"run: {' '.join(cmd)}")
+    if capture == "stderr":
+        return subprocess.run(
+            cmd,
+            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=check,
+            cwd=cwd,
+        )
     return subprocess.run(
         cmd,
         text=True,
@@ -110,21 +135,46 @@ def run(
     )
 
 
+def use_uv(default: bool = False) -> bool:
+    """Return True if package installs should go through ``uv pip``.
+
+    ``TOOLBOXCTL_USE_UV=1`` / ``=0`` forces the choice; otherwise *default*
+    applies (uv must be on PATH either way).  uv resolves and installs much
+    faster than pip, but does not read pip's configuration.
+    """
+    import os
+    import shutil
+
+    setting = os.environ.get("TOOLBOXCTL_USE_UV")
+    wanted = default if setting is None else setting == "1"
+    return wanted and shutil.which("uv") is not None
+
+
+def pip_cmd(python: str, *args: str, uv: bool | None = None) -> list[str]:
+    """Return the argv for ``pip <args>`` against *python*'s environment.
+
+    *uv* defaults to :func:`use_uv`.
+    """
+    if use_uv() if uv is None else uv:
+        return ["uv", "pip", *args, "--python", python]
+    return [python, "-m", "pip", *args]
+
+
 # ---------------------------------------------------------------------------
 # Table printer
 # ---------------------------------------------------------------------------
 
 
 def print_table(
-    rows: Sequence[Sequence[Any]],
+    rows: Iterable[Sequence[Any]],
     headers: Sequence[str] | None = None,
 ) -> None:
     """Print a simple aligned table to stderr.
 
     Parameters
     ----------
-    rows : list of tuples/lists
-        Each inner sequence is one row.
+    rows : iterable of tuples/lists
+        Each inner sequence is one row.  Consumed once, so a generator works.
     headers : list of str, optional
         Column headers (printed bold).
     """
@@ -137,28 +187,21 @@ def print_table(
     if not all_rows:
         return
 
-    ncols = max(len(r) for r in all_rows)
-    widths = [0] * ncols
-    for r in all_rows:
-        for i, c in enumerate(r):
-            widths[i] = max(widths[i], len(c))
-
-    def _fmt(row: list[str], bold: bool = False) -> str:
-        parts = []
-        for i, c in enumerate(row):
-            padded = c.ljust(widths[i])
-            parts.append(_bold(padded) if bold else padded)
-        return "  ".join(parts)
+    # Column-wise max in one pass; short rows pad with "" (width 0)
+    widths = [max(map(len, col)) for col in zip_longest(*all_rows, fillvalue="")]
 
+    sep = "  "
+    lines: list[str] = []
     if headers:
-        print(_fmt(all_rows[0], bold=True), file=sys.stderr)
-        print("  ".join("─" * w for w in widths), file=sys.stderr)
+        lines.append(sep.join([_bold(c.ljust(w)) for c, w in zip(all_rows[0], widths)]))
+        lines.append(sep.join(["─" * w for w in widths]))
         data = all_rows[1:]
     else:
         data = all_rows
+    lines.extend(sep.join([c.ljust(w) for c, w in zip(r, widths)]) for r in data)
 
-    for r in data:
-        print(_fmt(r), file=sys.stderr)
+    # One write for the whole table instead of one print() per row
+    sys.stderr.write("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -173,7 +216,7 @@ def ask_yes_no(prompt: str, default: bool = False) -> bool:
     """
     suffix = "[Y/n]" if default else "[y/N]"
     try:
-        answer = input(f"{_yellow('?')} {prompt} {suffix} ").strip().lower()
+        answer = input(f"{_SIGIL_ASK} {prompt} {suffix} ").strip().lower()
         if not answer:
             return default
         return answer in ("y", "yes")
@@ -13,20 +13,14 @@ Reversible via ``toolboxctl deinit``.
 
 from __future__ import annotations
 
-import importlib.resources
-import json
+import functools
+import os
 import shutil
 from pathlib import Path
 
+from toolbox._jsonio import loads, write_json
 from toolbox.config import CONFIG_FILENAME, DEFAULTS, write_config
 from toolbox.helpers import ask_yes_no, info, warn
-from toolbox.project_wiring import (
-    _ensure_gitignore,
-    install_project_claude_md,
-    install_project_manifest,
-    install_project_md,
-    uninstall_project_claude_md,
-)
 
 # ---------------------------------------------------------------------------
 # Per-project permissions (colon-glob format for Claude Code matching)
@@ -52,44 +46,90 @@ _STALE_PROJECT_PERMISSIONS = [
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def _templates_root() -> Path:
-    """Return the filesystem path to the shipped templates/ directory."""
+    """Return the filesystem path to the shipped templates/ directory.
+
+    Cached: the package location is fixed for the lifetime of the process.
+    """
+    import importlib.resources
+
     ref = importlib.resources.files("toolbox") / "templates"
     # importlib.resources may return a Traversable; resolve to real path
     return Path(str(ref))
 
 
+@functools.cache
+def _command_files() -> tuple[Path, ...]:
+    """Return the shipped slash-command templates, sorted by name."""
+    commands_src = _templates_root() / "commands"
+    if not commands_src.is_dir():
+        return ()
+    return tuple(sorted(p for p in commands_src.iterdir() if p.is_file()))
+
+
 # ---------------------------------------------------------------------------
 # File copy helper
 # ---------------------------------------------------------------------------
 
 
-def _copy_file(src: Path, dst: Path, *, force: bool = False) -> bool:
-    """Copy *src* to *dst*.  Return True if the file was written."""
-    if dst.exists() and not force:
+def _copy_file(
+    src: Path, dst: Path, *, force: bool = False, exists: bool | None = None,
+) -> bool:
+    """Copy *src* to *dst*.  Return True if the file was written.
+
+    *exists* lets a caller that already listed the destination directory
+    skip the per-file ``stat``; None means check here.
+    """
+    if exists is None:
+        exists = dst.exists()
+    if exists and not force:
         warn(f"Skipped (exists): {dst}")
         return False
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    shutil.copyfile(src, dst)  # contents only: template mtimes/modes are irrelevant
     info(f"Wrote {dst}")
     return True
 
 
-def _merge_settings(template_path: Path, target_path: Path, *, force: bool = False) -> None:
+def _settings_stamp(template_path: Path, target_path: Path) -> list[int] | None:
+    """Return the (template mtime, target mtime, target size) stamp, or None."""
+    try:
+        st = target_path.stat()
+        return [template_path.stat().st_mtime_ns, st.st_mtime_ns, st.st_size]
+    except FileNotFoundError:
+        return None
+
+
+def _merge_settings(
+    template_path: Path,
+    target_path: Path,
+    *,
+    force: bool = False,
+    state: dict | None = None,
+) -> None:
     """Merge toolbox MCP servers into existing settings.json.
 
     Only injects ``mcpServers.memctl`` and ``mcpServers.cloakmcp``.
     Never touches permissions, hooks, or other user configuration.
     Existing MCP server entries are overwritten only with --force.
+
+    With *state* (``.toolbox/state.json``), the outcome is stamped with the
+    template and target file stats; a re-run against unchanged files skips
+    reading and parsing both.
     """
-    with open(template_path, encoding="utf-8") as fh:
-        template = json.load(fh)
+    if state is not None and not force:
+        stamp = _settings_stamp(template_path, target_path)
+        if stamp is not None and state.get("settings_stamp") == stamp:
+            info(f"MCP servers already registered in {target_path}, skipping.")
+            return
+
+    template = loads(template_path.read_bytes())
 
     toolbox_servers = template.get("mcpServers", {})
 
     if target_path.exists():
-        with open(target_path, encoding="utf-8") as fh:
-            existing = json.load(fh)
+        existing = loads(target_path.read_bytes())
     else:
         existing = {}
 
@@ -106,14 +146,14 @@ def _merge_settings(template_path: Path, target_path: Path, *, force: bool = Fal
             info(f"Registered MCP server: {name}")
 
     if changed:
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(target_path, "w", encoding="utf-8") as fh:
-            json.dump(existing, fh, indent=2)
-            fh.write("\n")
+        write_json(target_path, existing)
         info(f"Wrote {target_path}")
     else:
         info(f"No changes to {target_path}")
 
+    if state is not None:
+        state["settings_stamp"] = _settings_stamp(template_path, target_path)
+
 
 def _merge_permissions(target_path: Path) -> None:
     """Inject cloak/memctl/toolboxctl Bash permissions into settings.local.json.
@@ -123,9 +163,8 @@ def _merge_permissions(target_path: Path) -> None:
     """
     if target_path.exists():
         try:
-            with open(target_path, encoding="utf-8") as fh:
-                existing = json.load(fh)
-        except (json.JSONDecodeError, ValueError):
+            existing = loads(target_path.read_bytes())
+        except ValueError:
             warn(f"Could not parse {target_path} — treating as empty.")
             existing = {}
     else:
@@ -149,10 +188,7 @@ def _merge_permissions(target_path: Path) -> None:
             added.append(perm)
 
     if added or changed:
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(target_path, "w", encoding="utf-8") as fh:
-            json.dump(existing, fh, indent=2)
-            fh.write("\n")
+        write_json(target_path, existing)
         for perm in added:
             info(f"Project permission added: {perm}")
         if changed and not added:
@@ -168,6 +204,14 @@ def _merge_permissions(target_path: Path) -> None:
 
 def cmd_init(args) -> None:
     """Entry point for ``toolboxctl init``."""
+    from toolbox.project_wiring import (
+        _ensure_gitignore,
+        _state_session,
+        install_project_claude_md,
+        install_project_manifest,
+        install_project_md,
+    )
+
     force: bool = getattr(args, "force", False)
     fts: str = getattr(args, "fts", "fr")
     profile: str = getattr(args, "profile", "minimal")
@@ -175,44 +219,49 @@ def cmd_init(args) -> None:
     templates = _templates_root()
 
     # --- Slash commands ----------------------------------------------------
-    commands_src = templates / "commands"
     commands_dst = cwd / ".claude" / "commands"
-    if commands_src.is_dir():
-        for src_file in sorted(commands_src.iterdir()):
-            if src_file.is_file():
-                _copy_file(src_file, commands_dst / src_file.name, force=force)
-
-    # --- settings.json (merge MCP servers into existing) -------------------
-    settings_src = templates / "settings.json"
-    settings_dst = cwd / ".claude" / "settings.json"
-    if settings_src.is_file():
-        _merge_settings(settings_src, settings_dst, force=force)
-
-    # --- settings.local.json (merge Bash permissions) ---------------------
-    settings_local_dst = cwd / ".claude" / "settings.local.json"
-    _merge_permissions(settings_local_dst)
-
-    # --- Config file ------------------------------------------------------
-    config_dst = cwd / CONFIG_FILENAME
-    if config_dst.exists() and not force:
-        warn(f"Skipped (exists): {config_dst}")
-    else:
-        # Build config from defaults, override FTS if requested
-        cfg = {section: dict(values) for section, values in DEFAULTS.items()}
-        if fts:
-            cfg["memctl"]["fts"] = fts
-        write_config(cfg, config_dst)
-        info(f"Wrote {config_dst}")
+    try:
+        with os.scandir(commands_dst) as it:
+            present = {entry.name for entry in it}
+    except FileNotFoundError:
+        present = set()
+    for src_file in _command_files():
+        _copy_file(src_file, commands_dst / src_file.name, force=force,
+                   exists=src_file.name in present)
+
+    # One state load and at most one save for the whole wiring pass
+    with _state_session(cwd) as state:
+        # --- settings.json (merge MCP servers into existing) ---------------
+        settings_src = templates / "settings.json"
+        settings_dst = cwd / ".claude" / "settings.json"
+        if settings_src.is_file():
+            _merge_settings(settings_src, settings_dst, force=force, state=state)
+
+        # --- settings.local.json (merge Bash permissions) -----------------
+        settings_local_dst = cwd / ".claude" / "settings.local.json"
+        _merge_permissions(settings_local_dst)
+
+        # --- Config file --------------------------------------------------
+        config_dst = cwd / CONFIG_FILENAME
+        if config_dst.exists() and not force:
+            warn(f"Skipped (exists): {config_dst}")
+        else:
+            # Build config from defaults, override FTS if requested
+            cfg = {section: dict(values) for section, values in DEFAULTS.items()}
+            if fts:
+                cfg["memctl"]["fts"] = fts
+            write_config(cfg, config_dst)
+            info(f"Wrote {config_dst}")
 
-    # --- CLAUDE.md (inject toolbox block) ---------------------------------
-    install_project_claude_md(cwd, force=force, profile=profile)
+        # --- CLAUDE.md (inject toolbox block) -----------------------------
+        install_project_claude_md(cwd, force=force, profile=profile, state=state)
 
-    # --- .claude/PROJECT.md (dev profile only) ----------------------------
-    if profile == "dev":
-        install_project_md(cwd, force=force)
+        # --- .claude/PROJECT.md (dev profile only) ------------------------
+        if profile == "dev":
+            install_project_md(cwd, force=force)
 
-    # --- Manifest + state -------------------------------------------------
-    install_project_manifest(cwd, profile=profile)
+        # --- Manifest + state ---------------------------------------------
+        install_project_manifest(cwd, profile=profile)
 
     # --- .gitignore -------------------------------------------------------
     _ensure_gitignore(cwd)
@@ -231,6 +280,31 @@ _TOOLBOX_MCP_SERVERS = {"memctl", "cloakmcp"}
 _TOOLBOX_COMMANDS = [
     "cheat.md", "eco.md", "how.md", "tldr.md", "why.md",
 ]
+_TOOLBOX_COMMANDS_SET = frozenset(_TOOLBOX_COMMANDS)
+
+# Toolbox bookkeeping files under .toolbox/
+_TOOLBOX_STATE_FILES = frozenset({"manifest.json", "state.json"})
+
+
+def _unlink_named(directory: Path, names: frozenset[str]) -> tuple[list[str], bool]:
+    """Unlink the entries of *directory* whose names are in *names*.
+
+    One directory scan replaces an exists()/unlink() pair per candidate.
+    Returns the removed names (sorted) and whether *directory* is now
+    empty; a missing directory yields ``([], False)``.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        return [], False
+    removed = []
+    for entry in entries:
+        if entry.name in names:
+            os.unlink(entry.path)
+            removed.append(entry.name)
+    removed.sort()
+    return removed, len(removed) == len(entries)
 
 
 def _teardown(cwd: Path) -> None:
@@ -239,13 +313,10 @@ def _teardown(cwd: Path) -> None:
 
     # 1. Remove slash command files
     commands_dir = cwd / ".claude" / "commands"
-    for cmd_file in _TOOLBOX_COMMANDS:
-        target = commands_dir / cmd_file
-        if target.exists():
-            target.unlink()
-            removed.append(f".claude/commands/{cmd_file}")
+    names, empty = _unlink_named(commands_dir, _TOOLBOX_COMMANDS_SET)
+    removed.extend(f".claude/commands/{name}" for name in names)
     # Remove empty commands dir
-    if commands_dir.exists() and not any(commands_dir.iterdir()):
+    if empty:
         commands_dir.rmdir()
         info("Removed empty .claude/commands/")
 
@@ -253,9 +324,8 @@ def _teardown(cwd: Path) -> None:
     settings_json = cwd / ".claude" / "settings.json"
     if settings_json.exists():
         try:
-            with open(settings_json, encoding="utf-8") as fh:
-                settings = json.load(fh)
-        except (json.JSONDecodeError, ValueError):
+            settings = loads(settings_json.read_bytes())
+        except ValueError:
             settings = {}
 
         mcp = settings.get("mcpServers", {})
@@ -269,9 +339,7 @@ def _teardown(cwd: Path) -> None:
             del settings["mcpServers"]
 
         if settings:
-            with open(settings_json, "w", encoding="utf-8") as fh:
-                json.dump(settings, fh, indent=2)
-                fh.write("\n")
+            write_json(settings_json, settings)
         else:
             settings_json.unlink()
             removed.append(".claude/settings.json (empty, deleted)")
@@ -280,9 +348,8 @@ def _teardown(cwd: Path) -> None:
     settings_local = cwd / ".claude" / "settings.local.json"
     if settings_local.exists():
         try:
-            with open(settings_local, encoding="utf-8") as fh:
-                local = json.load(fh)
-        except (json.JSONDecodeError, ValueError):
+            local = loads(settings_local.read_bytes())
+        except ValueError:
             local = {}
 
         allow = local.get("permissions", {}).get("allow", [])
@@ -299,9 +366,7 @@ def _teardown(cwd: Path) -> None:
                 del local["permissions"]
 
             if local:
-                with open(settings_local, "w", encoding="utf-8") as fh:
-                    json.dump(local, fh, indent=2)
-                    fh.write("\n")
+                write_json(settings_local, local)
             else:
                 settings_local.unlink()
                 removed.append(".claude/settings.local.json (empty, deleted)")
@@ -319,20 +384,16 @@ def _teardown(cwd: Path) -> None:
         removed.append(CONFIG_FILENAME)
 
     # 6. Remove toolbox block from CLAUDE.md
+    from toolbox.project_wiring import uninstall_project_claude_md
+
     if uninstall_project_claude_md(cwd):
         removed.append("CLAUDE.md (toolbox block)")
 
     # 7. Remove manifest and state
     toolbox_dir = cwd / ".toolbox"
-    manifest = toolbox_dir / "manifest.json"
-    state = toolbox_dir / "state.json"
-    if manifest.exists():
-        manifest.unlink()
-        removed.append(".toolbox/manifest.json")
-    if state.exists():
-        state.unlink()
-        removed.append(".toolbox/state.json")
-    if toolbox_dir.exists() and not any(toolbox_dir.iterdir()):
+    names, empty = _unlink_named(toolbox_dir, _TOOLBOX_STATE_FILES)
+    removed.extend(f".toolbox/{name}" for name in names)
+    if empty:
         toolbox_dir.rmdir()
         removed.append(".toolbox/ (empty, deleted)")
 
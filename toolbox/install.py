@@ -10,9 +10,10 @@ Supports two modes:
 
 from __future__ import annotations
 
+import functools
 import sys
 
-from toolbox.helpers import die, error, info, run, warn
+from toolbox.helpers import die, error, info, pip_cmd, run, warn
 
 MEMCTL_SPEC = "memctl[mcp,docs]"
 CLOAKMCP_SPEC = "cloakmcp"
@@ -25,8 +26,9 @@ CLOAKMCP_SPEC = "cloakmcp"
 
 def _pip(*args: str, check: bool = True) -> bool:
     """Run pip via the current interpreter."""
-    cmd = [sys.executable, "-m", "pip", *args]
-    result = run(cmd, check=False, quiet=True)
+    cmd = pip_cmd(sys.executable, *args)
+    result = run(cmd, check=False, quiet=True, capture="stderr")
+    _installed_set.cache_clear()
     if result.returncode != 0:
         if check:
             error(f"pip failed: {result.stderr.strip()}")
@@ -34,11 +36,26 @@ def _pip(*args: str, check: bool = True) -> bool:
     return True
 
 
+@functools.cache
+def _installed_set() -> frozenset[str]:
+    """Return the lower-cased names of all installed distributions.
+
+    One in-process metadata scan of the running interpreter (the environment
+    ``sys.executable -m pip`` installs into) instead of a ``pip show``
+    subprocess per package.  Cached until :func:`_pip` changes the set.
+    """
+    from importlib.metadata import distributions
+
+    return frozenset(
+        name.lower()
+        for name in (d.metadata["Name"] for d in distributions())
+        if name
+    )
+
+
 def _is_installed(package: str) -> bool:
-    """Check if a package is already installed (pip show)."""
-    cmd = [sys.executable, "-m", "pip", "show", package]
-    result = run(cmd, check=False, quiet=True, capture=True)
-    return result.returncode == 0
+    """Check if a package is already installed."""
+    return package.lower() in _installed_set()
 
 
 # ---------------------------------------------------------------------------
@@ -63,23 +80,23 @@ def cmd_install(args) -> None:
     if upgrade:
         pip_extra.append("--upgrade")
 
-    # --- memctl -----------------------------------------------------------
-    if _is_installed("memctl") and not upgrade:
-        info("memctl is already installed (use --upgrade to force).")
-    else:
-        info("Installing memctl …")
-        if not _pip("install", *pip_extra, MEMCTL_SPEC):
-            die("Failed to install memctl.", code=2)
-        info("memctl installed.")
-
-    # --- CloakMCP ---------------------------------------------------------
-    if _is_installed("cloakmcp") and not upgrade:
-        info("CloakMCP is already installed (use --upgrade to force).")
-    else:
-        info("Installing CloakMCP …")
-        if not _pip("install", *pip_extra, CLOAKMCP_SPEC):
-            die("Failed to install CloakMCP.", code=2)
-        info("CloakMCP installed.")
+    # --- memctl + CloakMCP (one pip resolver pass) ------------------------
+    pending: list[tuple[str, str]] = []  # (label, spec)
+    for label, dist, spec in (
+        ("memctl", "memctl", MEMCTL_SPEC),
+        ("CloakMCP", "cloakmcp", CLOAKMCP_SPEC),
+    ):
+        if _is_installed(dist) and not upgrade:
+            info(f"{label} is already installed (use --upgrade to force).")
+        else:
+            pending.append((label, spec))
+
+    if pending:
+        labels = " + ".join(label for label, _ in pending)
+        info(f"Installing {labels} …")
+        if not _pip("install", *pip_extra, *(spec for _, spec in pending)):
+            die(f"Failed to install {labels}.", code=2)
+        info(f"{labels} installed.")
 
     # --- Global permissions (always) --------------------------------------
     from toolbox.global_wiring import install_global_permissions
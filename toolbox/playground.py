@@ -12,10 +12,11 @@ from __future__ import annotations
 
 import shutil
 import sys
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from toolbox.helpers import die, error, info, run, warn
+from toolbox._jsonio import atomic_write
+from toolbox.helpers import die, error, info, pip_cmd, run, use_uv, warn
 
 PLAYGROUND_DIR = ".playground"
 LOG_FILE = f"{PLAYGROUND_DIR}/playground.log"
@@ -23,18 +24,50 @@ LOG_FILE = f"{PLAYGROUND_DIR}/playground.log"
 MEMCTL_SPEC = "memctl[mcp,docs]"
 CLOAKMCP_SPEC = "cloakmcp"
 
+# Fingerprint of the last successful dev-mode install, inside the venv
+INSTALL_STAMP = ".install_stamp"
+
+# CLI tools under test, and the smoke tests run against them:
+# (tool, argv tail, label)
+_TOOLS = ("toolboxctl", "memctl", "cloak")
+_SMOKE_SPECS = (
+    ("toolboxctl", ("--version",), "toolboxctl --version"),
+    ("toolboxctl", ("status",), "toolboxctl status"),
+    ("memctl", ("--version",), "memctl --version"),
+    ("cloak", ("--version",), "cloak --version"),
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _log(lines: list[str], path: Path) -> None:
-    """Append lines to the log file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a", encoding="utf-8") as fh:
-        for line in lines:
-            fh.write(line + "\n")
+def _install_stamp(cwd: Path, uv: bool) -> str:
+    """Fingerprint what a dev-mode install depends on.
+
+    Covers ``pyproject.toml`` (dependencies, entry points), the sibling
+    specs, the interpreter version and the installer (uv or pip).  Source
+    edits need no reinstall: the toolbox is installed editable.
+    """
+    import hashlib
+
+    h = hashlib.sha256((cwd / "pyproject.toml").read_bytes())
+    for part in (MEMCTL_SPEC, CLOAKMCP_SPEC, sys.version, "uv" if uv else "pip"):
+        h.update(b"\0" + part.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _bundled_pip_too_old() -> bool:
+    """True if the interpreter's bundled pip predates PEP 660 editable installs.
+
+    Only early 3.10 releases ship such a pip (< 21.3); the version comes
+    from ensurepip in-process, without starting pip.
+    """
+    import ensurepip
+
+    major, minor = ensurepip.version().split(".")[:2]
+    return (int(major), int(minor)) < (21, 3)
 
 
 def _check_cmd(cmd: str) -> tuple[bool, str]:
@@ -69,85 +102,114 @@ def cmd_playground(args) -> None:
     # Detect mode: dev (pyproject.toml present) vs standard (pipx)
     dev_mode = (cwd / "pyproject.toml").exists()
 
-    log_entries: list[str] = [
-        f"# Playground log — {datetime.now(timezone.utc).isoformat()}",
-        f"# Mode: {'dev (editable)' if dev_mode else 'standard (PATH)'}",
-        "",
-    ]
-
-    if dev_mode:
-        # Dev mode: create venv, install editable + deps
-        venv_path = cwd / PLAYGROUND_DIR / "venv"
-        if venv_path.exists():
-            info("Playground venv already exists, reusing.")
-        else:
-            info("Creating playground venv …")
-            run([sys.executable, "-m", "venv", str(venv_path)])
-
-        py = str(venv_path / "bin" / "python")
-        run([py, "-m", "pip", "install", "--upgrade", "pip"], quiet=True)
-
-        info("Installing toolbox (editable) + deps …")
-        r = run([py, "-m", "pip", "install", "-e", str(cwd)], check=False, quiet=True)
-        log_entries.append(f"toolbox install: {'OK' if r.returncode == 0 else 'FAIL'}")
-
-        info("Installing memctl …")
-        r = run([py, "-m", "pip", "install", MEMCTL_SPEC], check=False, quiet=True)
-        log_entries.append(f"memctl install: {'OK' if r.returncode == 0 else 'FAIL'}")
-
-        info("Installing CloakMCP …")
-        r = run([py, "-m", "pip", "install", CLOAKMCP_SPEC], check=False, quiet=True)
-        log_entries.append(f"CloakMCP install: {'OK' if r.returncode == 0 else 'FAIL'}")
-
-        toolboxctl_bin = str(venv_path / "bin" / "toolboxctl")
-        memctl_bin = str(venv_path / "bin" / "memctl")
-        cloak_bin = str(venv_path / "bin" / "cloak")
-    else:
-        # Standard mode: verify tools on PATH
-        info("Verifying installed tools …")
-
-        for cmd in ("toolboxctl", "memctl", "cloak"):
-            found, path = _check_cmd(cmd)
-            if found:
-                info(f"  {cmd}: {path}")
-                log_entries.append(f"{cmd}: {path}")
+    from datetime import datetime, timezone
+
+    # Stream entries to the log as they happen (line-buffered, no fsync):
+    # an interrupted install still leaves a log behind
+    pg.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "a", encoding="utf-8", buffering=1) as log_fh:
+
+        def _emit(line: str) -> None:
+            log_fh.write(line + "\n")
+
+        _emit(f"# Playground log — {datetime.now(timezone.utc).isoformat()}")
+        _emit(f"# Mode: {'dev (editable)' if dev_mode else 'standard (PATH)'}")
+        _emit("")
+
+        if dev_mode:
+            # Dev mode: create venv, install editable + deps
+            venv_path = cwd / PLAYGROUND_DIR / "venv"
+            # The venv is a throwaway sandbox: prefer uv whenever it is on PATH
+            uv = use_uv(default=True)
+            if venv_path.exists() and not uv and not (venv_path / "bin" / "pip").exists():
+                # Created by uv (no pip inside): rebuild it for the pip installer
+                info("Playground venv has no pip, recreating …")
+                shutil.rmtree(venv_path)
+            if venv_path.exists():
+                info("Playground venv already exists, reusing.")
             else:
-                error(f"  {cmd}: not found — run 'toolboxctl install' first")
-                log_entries.append(f"{cmd}: NOT FOUND")
-
-        toolboxctl_bin = shutil.which("toolboxctl") or "toolboxctl"
-        memctl_bin = shutil.which("memctl") or "memctl"
-        cloak_bin = shutil.which("cloak") or "cloak"
-
-    # Smoke tests
-    info("Running smoke tests …")
-    tests_passed = 0
-    tests_failed = 0
-
-    smoke_tests = [
-        ([toolboxctl_bin, "--version"], "toolboxctl --version"),
-        ([toolboxctl_bin, "status"], "toolboxctl status"),
-        ([memctl_bin, "--version"], "memctl --version"),
-        ([cloak_bin, "--version"], "cloak --version"),
-    ]
-
-    for cmd, label in smoke_tests:
-        r = run(cmd, check=False, quiet=True)
-        ok = r.returncode == 0
-        status = "PASS" if ok else "FAIL"
-        log_entries.append(f"  {status}: {label}")
-        if ok:
-            tests_passed += 1
-            info(f"  PASS: {label}")
+                info("Creating playground venv …")
+                if uv:
+                    run(["uv", "venv", "--python", sys.executable, str(venv_path)])
+                else:
+                    # Bundled pip from ensurepip's local wheel: no download
+                    run([sys.executable, "-m", "venv", str(venv_path)])
+                    if _bundled_pip_too_old():
+                        run([str(venv_path / "bin" / "python"), "-m", "pip", "install",
+                             "--upgrade", "pip"], quiet=True)
+
+            py = str(venv_path / "bin" / "python")
+
+            stamp_path = venv_path / INSTALL_STAMP
+            stamp = _install_stamp(cwd, uv)
+            try:
+                cached = stamp_path.read_text(encoding="utf-8") == stamp
+            except FileNotFoundError:
+                cached = False
+
+            if cached:
+                info("Playground packages unchanged, skipping install.")
+                _emit("toolbox + memctl + CloakMCP install: cached")
+            else:
+                # One resolver pass for all three distributions
+                info("Installing toolbox (editable) + memctl + CloakMCP …")
+                # pip only: take an existing wheel over building a newer sdist
+                extra = () if uv else ("--prefer-binary",)
+                r = run(
+                    pip_cmd(py, "install", *extra, "-e", str(cwd), MEMCTL_SPEC, CLOAKMCP_SPEC,
+                            uv=uv),
+                    check=False, quiet=True, capture="stderr",
+                )
+                ok = r.returncode == 0
+                _emit(f"toolbox + memctl + CloakMCP install: {'OK' if ok else 'FAIL'}")
+                if ok:
+                    atomic_write(stamp_path, stamp.encode("utf-8"))
+
+            bins = {tool: str(venv_path / "bin" / tool) for tool in _TOOLS}
         else:
-            tests_failed += 1
-            error(f"  FAIL: {label}")
+            # Standard mode: verify tools on PATH
+            info("Verifying installed tools …")
+
+            bins = {}
+            for cmd in _TOOLS:
+                found, path = _check_cmd(cmd)
+                if found:
+                    info(f"  {cmd}: {path}")
+                    _emit(f"{cmd}: {path}")
+                else:
+                    error(f"  {cmd}: not found — run 'toolboxctl install' first")
+                    _emit(f"{cmd}: NOT FOUND")
+                bins[cmd] = path if found else cmd
+
+        # Smoke tests
+        info("Running smoke tests …")
+        tests_passed = 0
+        tests_failed = 0
+
+        smoke_tests = [([bins[tool], *tail], label) for tool, tail, label in _SMOKE_SPECS]
+
+        # Independent cold-start processes: run concurrently, report in order
+        with ThreadPoolExecutor(max_workers=len(smoke_tests)) as pool:
+            results = list(pool.map(
+                lambda test: run(test[0], check=False, quiet=True, capture="stderr"),
+                smoke_tests,
+            ))
+
+        for (_, label), r in zip(smoke_tests, results):
+            ok = r.returncode == 0
+            status = "PASS" if ok else "FAIL"
+            _emit(f"  {status}: {label}")
+            if ok:
+                tests_passed += 1
+                info(f"  PASS: {label}")
+            else:
+                tests_failed += 1
+                error(f"  FAIL: {label}")
 
-    # Summary
-    log_entries.append("")
-    log_entries.append(f"Passed: {tests_passed}/{tests_passed + tests_failed}")
+        # Summary
+        _emit("")
+        _emit(f"Passed: {tests_passed}/{tests_passed + tests_failed}")
 
-    _log(log_entries, log_path)
     info(f"Log written to {log_path}")
 
     if tests_failed:
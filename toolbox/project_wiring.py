@@ -11,11 +11,12 @@ All operations are idempotent and reversible.
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
+import copy
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
-from toolbox import __version__
+from toolbox._jsonio import read_json, write_json
 from toolbox.helpers import info, warn
 
 # ---------------------------------------------------------------------------
@@ -95,31 +96,6 @@ _GITIGNORE_ENTRIES = [
 ]
 
 
-# ---------------------------------------------------------------------------
-# JSON helpers
-# ---------------------------------------------------------------------------
-
-
-def _read_json(path: Path) -> dict:
-    """Read a JSON file, returning {} if it doesn't exist or is empty."""
-    if not path.exists():
-        return {}
-    try:
-        with open(path, encoding="utf-8") as fh:
-            return json.load(fh)
-    except (json.JSONDecodeError, ValueError):
-        warn(f"Could not parse {path} — treating as empty.")
-        return {}
-
-
-def _write_json(path: Path, data: dict) -> None:
-    """Write a JSON file with consistent formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2)
-        fh.write("\n")
-
-
 # ---------------------------------------------------------------------------
 # State tracking (.toolbox/state.json — untracked)
 # ---------------------------------------------------------------------------
@@ -127,12 +103,28 @@ def _write_json(path: Path, data: dict) -> None:
 
 def _load_state(cwd: Path) -> dict:
     """Load .toolbox/state.json or return empty state."""
-    return _read_json(cwd / TOOLBOX_DIR / STATE_FILE)
+    return read_json(cwd / TOOLBOX_DIR / STATE_FILE)
 
 
 def _save_state(cwd: Path, state: dict) -> None:
     """Write .toolbox/state.json."""
-    _write_json(cwd / TOOLBOX_DIR / STATE_FILE, state)
+    write_json(cwd / TOOLBOX_DIR / STATE_FILE, state)
+
+
+@contextmanager
+def _state_session(cwd: Path) -> Iterator[dict]:
+    """Load .toolbox/state.json once for a batch of wiring steps.
+
+    Callers mutate the yielded dict; it is written back on exit (also on
+    error, so completed steps stay reversible) and only if it changed.
+    """
+    state = _load_state(cwd)
+    before = copy.deepcopy(state)
+    try:
+        yield state
+    finally:
+        if state != before:
+            _save_state(cwd, state)
 
 
 def _record_created(state: dict, path: str) -> None:
@@ -155,11 +147,15 @@ def _record_modified(state: dict, path: str, action: str, existed_before: bool)
 
 def install_project_manifest(cwd: Path, *, profile: str = "minimal") -> None:
     """Create or update .toolbox/manifest.json."""
+    from datetime import datetime, timezone
+
+    from toolbox import __version__
+
     manifest_path = cwd / TOOLBOX_DIR / MANIFEST_FILE
     now = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
     if manifest_path.exists():
-        manifest = _read_json(manifest_path)
+        manifest = read_json(manifest_path)
         manifest["toolbox_version"] = __version__
         manifest["updated_timestamp"] = now
         manifest["profile"] = profile
@@ -181,7 +177,7 @@ def install_project_manifest(cwd: Path, *, profile: str = "minimal") -> None:
         }
         info("Created .toolbox/manifest.json")
 
-    _write_json(manifest_path, manifest)
+    write_json(manifest_path, manifest)
 
 
 # ---------------------------------------------------------------------------
@@ -190,7 +186,8 @@ def install_project_manifest(cwd: Path, *, profile: str = "minimal") -> None:
 
 
 def install_project_claude_md(cwd: Path, *, force: bool = False,
-                              profile: str = "minimal") -> bool:
+                              profile: str = "minimal",
+                              state: dict | None = None) -> bool:
     """Write or update the toolbox block in project CLAUDE.md.
 
     - Creates the file if missing.
@@ -198,36 +195,46 @@ def install_project_claude_md(cwd: Path, *, force: bool = False,
     - Updates the block in-place if markers already exist.
     - Block content depends on the profile (minimal/dev/playground).
 
+    Changes are recorded in *state* for deinit; without one, the state
+    file is loaded and saved here (see :func:`_state_session`).
+
     Returns True if changes were made.
     """
+    if state is None:
+        with _state_session(cwd) as state:
+            return install_project_claude_md(cwd, force=force, profile=profile,
+                                             state=state)
+
     claude_md = cwd / "CLAUDE.md"
     block_content = _build_project_block(cwd, profile=profile)
     full_block = f"{_PROJECT_BLOCK_BEGIN}\n{block_content}{_PROJECT_BLOCK_END}\n"
 
-    # Track state for deinit
-    state = _load_state(cwd)
-
     if not claude_md.exists():
         claude_md.write_text(full_block, encoding="utf-8")
         _record_created(state, "CLAUDE.md")
-        _save_state(cwd, state)
         info("Created CLAUDE.md with toolbox block.")
         return True
 
     content = claude_md.read_text(encoding="utf-8")
-
-    if _PROJECT_BLOCK_BEGIN in content and _PROJECT_BLOCK_END in content:
-        # Replace existing block
-        before = content[: content.index(_PROJECT_BLOCK_BEGIN)]
-        after = content[content.index(_PROJECT_BLOCK_END) + len(_PROJECT_BLOCK_END) :]
-        after = after.lstrip("\n")
-        new_content = before + full_block + after
-        if new_content == content:
+    begin = content.find(_PROJECT_BLOCK_BEGIN)
+    end = content.find(_PROJECT_BLOCK_END)
+
+    if begin >= 0 and end >= 0:
+        # Up to date iff the block sits verbatim at *begin* and no blank
+        # lines follow it: checked in place, without building the new text
+        block_end = begin + len(full_block)
+        if (
+            content.startswith(full_block, begin)
+            and end == block_end - len(_PROJECT_BLOCK_END) - 1
+            and not content.startswith("\n", block_end)
+        ):
             info("CLAUDE.md toolbox block already up to date.")
             return False
-        claude_md.write_text(new_content, encoding="utf-8")
+        # Replace existing block
+        before = content[:begin]
+        after = content[end + len(_PROJECT_BLOCK_END) :].lstrip("\n")
+        claude_md.write_text(before + full_block + after, encoding="utf-8")
         _record_modified(state, "CLAUDE.md", "replaced_block", True)
-        _save_state(cwd, state)
         info("Updated toolbox block in CLAUDE.md.")
         return True
 
@@ -236,7 +243,6 @@ def install_project_claude_md(cwd: Path, *, force: bool = False,
     separator += "\n" if content else ""
     claude_md.write_text(content + separator + full_block, encoding="utf-8")
     _record_modified(state, "CLAUDE.md", "appended_block", True)
-    _save_state(cwd, state)
     info("Appended toolbox block to CLAUDE.md.")
     return True
 
@@ -252,16 +258,17 @@ def uninstall_project_claude_md(cwd: Path) -> bool:
         return False
 
     content = claude_md.read_text(encoding="utf-8")
-
-    if _PROJECT_BLOCK_BEGIN not in content:
+    begin = content.find(_PROJECT_BLOCK_BEGIN)
+    if begin < 0:
         return False
 
-    if _PROJECT_BLOCK_END not in content:
+    end = content.find(_PROJECT_BLOCK_END)
+    if end < 0:
         warn("Found BEGIN marker but no END marker in CLAUDE.md — skipping.")
         return False
 
-    before = content[: content.index(_PROJECT_BLOCK_BEGIN)]
-    after = content[content.index(_PROJECT_BLOCK_END) + len(_PROJECT_BLOCK_END) :]
+    before = content[:begin]
+    after = content[end + len(_PROJECT_BLOCK_END) :]
 
     # Clean up extra blank lines around the removed block
     new_content = before.rstrip("\n") + after.lstrip("\n")
@@ -321,11 +328,11 @@ def _ensure_gitignore(cwd: Path) -> bool:
     else:
         content = ""
 
-    lines = content.splitlines()
-    added = []
-    for entry in _GITIGNORE_ENTRIES:
-        if entry not in lines:
-            added.append(entry)
+    # Whole-line match as a substring test on the newline-wrapped text
+    wrapped = f"\n{content}\n"
+    if "\r" in wrapped:
+        wrapped = wrapped.replace("\r\n", "\n")
+    added = [entry for entry in _GITIGNORE_ENTRIES if f"\n{entry}\n" not in wrapped]
 
     if not added:
         return False
@@ -334,7 +341,7 @@ def _ensure_gitignore(cwd: Path) -> bool:
     parts = []
     if content and not content.endswith("\n"):
         parts.append("\n")
-    if not any("toolbox" in line.lower() for line in lines):
+    if "toolbox" not in content.lower():
         parts.append("\n# Adservio Toolbox (untracked)\n")
     for entry in added:
         parts.append(f"{entry}\n")
@@ -363,12 +370,22 @@ def check_project_wiring(cwd: Path) -> dict:
 
     manifest_path = cwd / TOOLBOX_DIR / MANIFEST_FILE
     if manifest_path.exists():
-        manifest = _read_json(manifest_path)
+        manifest = read_json(manifest_path)
         result["manifest_present"] = True
         result["toolbox_version"] = manifest.get("toolbox_version")
         result["features"] = manifest.get("features", [])
         result["profile"] = manifest.get("profile")
 
+    # Eco mode: active when .claude/eco/ECO.md exists and .disabled is absent
+    # (eco can be switched on in a project that was never init'ed)
+    eco_md = cwd / ".claude" / "eco" / "ECO.md"
+    eco_disabled = cwd / ".claude" / "eco" / ".disabled"
+    result["eco_active"] = eco_md.exists() and not eco_disabled.exists()
+
+    # No manifest: not wired, so skip probing for init artifacts
+    if not result["manifest_present"]:
+        return result
+
     claude_md = cwd / "CLAUDE.md"
     if claude_md.exists():
         content = claude_md.read_text(encoding="utf-8")
@@ -376,11 +393,6 @@ def check_project_wiring(cwd: Path) -> dict:
             _PROJECT_BLOCK_BEGIN in content and _PROJECT_BLOCK_END in content
         )
 
-    # Eco mode: active when .claude/eco/ECO.md exists and .disabled is absent
-    eco_md = cwd / ".claude" / "eco" / "ECO.md"
-    eco_disabled = cwd / ".claude" / "eco" / ".disabled"
-    result["eco_active"] = eco_md.exists() and not eco_disabled.exists()
-
     # .claude/PROJECT.md (dev profile artifact)
     result["has_project_md"] = (cwd / ".claude" / "PROJECT.md").exists()
 
@@ -18,15 +18,20 @@ imports.
 
 from __future__ import annotations
 
-import json
+import functools
+import os
 import re
 import shutil
+import subprocess
 import sys
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from toolbox._jsonio import atomic_write, dumps, loads, print_json
 from toolbox.helpers import (
+    _SIGIL_INFO,
     _bold,
     _cyan,
     _green,
@@ -46,6 +51,7 @@ from toolbox.helpers import (
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def _check_cloak() -> bool:
     """Return True if ``cloak`` is on PATH."""
     return shutil.which("cloak") is not None
@@ -61,44 +67,78 @@ def _cloak_status(directory: str) -> dict | None:
     if result.returncode != 0:
         return None
     try:
-        return json.loads(result.stdout)
-    except (json.JSONDecodeError, ValueError):
+        return loads(result.stdout)
+    except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
         return None
 
 
-def _has_stale_session(directory: str) -> bool:
+def _has_stale_session(directory: Path | str) -> bool:
     """Check for a ``.cloak-session-state`` file indicating an unfinished session."""
-    return (Path(directory) / ".cloak-session-state").is_file()
+    if not isinstance(directory, Path):
+        directory = Path(directory)
+    return (directory / ".cloak-session-state").is_file()
 
 
-def _scan_tags(directory: str) -> tuple[int, list[str]]:
+# Verify output lines kept for the post-recovery report
+_VERIFY_HEAD_LINES = 10
+
+
+@dataclass
+class _VerifyResult:
+    """``cloak verify`` outcome, parsed while its output streams in."""
+
+    returncode: int
+    tag_lines: int = 0
+    files: list[str] = field(default_factory=list)
+    head: list[str] = field(default_factory=list)
+
+
+def _cloak_verify(directory: str, *, quiet: bool = True) -> _VerifyResult:
+    """Run ``cloak verify --dir DIR``, parsing its stdout line by line.
+
+    Memory stays bounded by the distinct tagged files rather than the
+    whole report, and parsing overlaps with cloak's own scan.
+    """
+    cmd = ["cloak", "verify", "--dir", directory]
+    if not quiet:
+        info(f"run: {' '.join(cmd)}")
+    files: dict[str, None] = {}  # insertion-ordered set
+    head: list[str] = []
+    count = 0
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    ) as proc:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if len(head) < _VERIFY_HEAD_LINES and (head or line.strip()):
+                head.append(line)
+            # Lines containing TAG- indicate residual tags
+            if "TAG-" in line:
+                count += 1
+                # Extract filename if present (first token before ':')
+                fname, sep, _ = line.partition(":")
+                fname = fname.strip()
+                if sep and fname:
+                    files[fname] = None
+    while head and not head[-1].strip():
+        head.pop()
+    return _VerifyResult(proc.returncode, count, list(files), head)
+
+
+def _scan_tags(
+    directory: str,
+    result: _VerifyResult | None = None,
+) -> tuple[int, list[str]]:
     """Run ``cloak verify --dir DIR`` and return (tag_count, files_with_tags).
 
-    Returns (0, []) if verify reports clean or the command fails.
+    Pass *result* (from :func:`_cloak_verify`) to use an earlier run
+    instead.  Returns (0, []) if verify reports clean or the command fails.
     """
-    result = run(
-        ["cloak", "verify", "--dir", directory],
-        check=False,
-        quiet=True,
-    )
+    if result is None:
+        result = _cloak_verify(directory)
     if result.returncode == 0:
         return 0, []
-    # Parse verify output — lines typically list affected files
-    files: list[str] = []
-    count = 0
-    for line in result.stdout.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        # Lines containing TAG- indicate residual tags
-        if "TAG-" in stripped:
-            count += 1
-            # Extract filename if present (first token before ':')
-            if ":" in stripped:
-                fname = stripped.split(":")[0].strip()
-                if fname and fname not in files:
-                    files.append(fname)
-    return max(count, len(files)), files
+    return max(result.tag_lines, len(result.files)), result.files
 
 
 def _list_backups(directory: str) -> list[str]:
@@ -128,77 +168,48 @@ def _list_backups(directory: str) -> list[str]:
 # Memory detection helpers
 # ---------------------------------------------------------------------------
 
+_VERSION_RE = re.compile(r"(\d+(?:\.\d+)+)")
 
+
+@functools.cache
 def _check_memctl() -> bool:
     """Return True if ``memctl`` is on PATH."""
     return shutil.which("memctl") is not None
 
 
+@functools.cache
 def _memctl_version() -> tuple[int, ...] | None:
-    """Parse ``memctl --version`` into a version tuple, or None on failure."""
+    """Parse ``memctl --version`` into a version tuple, or None on failure.
+
+    Cached like the PATH checks: neither changes during one rescue run.
+    """
     result = run(["memctl", "--version"], check=False, quiet=True)
     if result.returncode != 0:
         return None
     # Expect output like "memctl 0.18.0" or just "0.18.0"
-    m = re.search(r"(\d+(?:\.\d+)+)", result.stdout.strip())
+    m = _VERSION_RE.search(result.stdout)
     if not m:
         return None
     return tuple(int(p) for p in m.group(1).split("."))
 
 
-def _memctl_doctor(directory: str) -> dict | None:
-    """Run ``memctl doctor --json`` in *directory* and return parsed dict."""
-    result = run(
-        ["memctl", "doctor", "--json"],
-        check=False, quiet=True, cwd=directory,
-    )
-    if result.returncode not in (0, 1):  # doctor exits 1 on warnings
-        return None
-    try:
-        return json.loads(result.stdout)
-    except (json.JSONDecodeError, ValueError):
-        return None
-
-
-def _memctl_status(directory: str) -> dict | None:
-    """Run ``memctl status --json`` in *directory* and return parsed dict."""
-    result = run(
-        ["memctl", "status", "--json"],
-        check=False, quiet=True, cwd=directory,
-    )
-    if result.returncode != 0:
-        return None
-    try:
-        return json.loads(result.stdout)
-    except (json.JSONDecodeError, ValueError):
-        return None
-
-
-def _memctl_stats(directory: str) -> dict | None:
-    """Run ``memctl stats --json`` in *directory* and return parsed dict."""
-    result = run(
-        ["memctl", "stats", "--json"],
-        check=False, quiet=True, cwd=directory,
-    )
-    if result.returncode != 0:
-        return None
-    try:
-        return json.loads(result.stdout)
-    except (json.JSONDecodeError, ValueError):
-        return None
-
+def _memctl_json(
+    directory: str, *subargs: str, ok_codes: tuple[int, ...] = (0,)
+) -> dict | None:
+    """Run ``memctl <subargs> --json`` in *directory* and return parsed dict.
 
-def _memctl_consolidate_dry(directory: str) -> dict | None:
-    """Run ``memctl consolidate --dry-run --json`` in *directory*."""
+    Returns None when the exit code is not in *ok_codes* or the output is
+    not valid JSON.
+    """
     result = run(
-        ["memctl", "consolidate", "--dry-run", "--json"],
+        ["memctl", *subargs, "--json"],
         check=False, quiet=True, cwd=directory,
     )
-    if result.returncode != 0:
+    if result.returncode not in ok_codes:
         return None
     try:
-        return json.loads(result.stdout)
-    except (json.JSONDecodeError, ValueError):
+        return loads(result.stdout)
+    except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
         return None
 
 
@@ -207,15 +218,18 @@ def _memctl_consolidate_dry(directory: str) -> dict | None:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryAdvisory:
-    """Read-only memory health diagnostic."""
+    """Read-only memory health diagnostic.
+
+    Field order is the ``--json`` key order (see :func:`_advisory_to_dict`).
+    """
 
     memctl_ok: bool = False
     memctl_version: str = ""
     doctor_available: bool = False
-    doctor_checks: list[dict] = field(default_factory=list)
     doctor_status: str = ""
+    doctor_checks: list[dict] = field(default_factory=list)
     db_path: str = ""
     db_exists: bool = False
     eco_mode: str = ""
@@ -242,15 +256,24 @@ def _diagnose_memory(directory: str) -> MemoryAdvisory:
         return adv
     adv.memctl_ok = True
 
+    # 2-4. Version, doctor and status are independent read-only probes: run
+    # them concurrently.  Doctor is speculative (its result is discarded
+    # before v0.18.0); stats and consolidate wait for db_exists below.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        ver_future = pool.submit(_memctl_version)
+        # doctor exits 1 on warnings
+        doc_future = pool.submit(_memctl_json, directory, "doctor", ok_codes=(0, 1))
+        st_future = pool.submit(_memctl_json, directory, "status")
+    ver = ver_future.result()
+
     # 2. Parse version
-    ver = _memctl_version()
     if ver:
         adv.memctl_version = ".".join(str(p) for p in ver)
         adv.doctor_available = ver >= (0, 18, 0)
 
     # 3. Doctor (v0.18.0+)
     if adv.doctor_available:
-        doc = _memctl_doctor(directory)
+        doc = doc_future.result()
         if doc:
             adv.doctor_status = doc.get("status", "")
             adv.doctor_checks = doc.get("checks", [])
@@ -268,7 +291,7 @@ def _diagnose_memory(directory: str) -> MemoryAdvisory:
                     adv.eco_mode = detail
 
     # 4. Status
-    st = _memctl_status(directory)
+    st = st_future.result()
     if st:
         if not adv.db_path:
             adv.db_path = st.get("db_path", st.get("db", ""))
@@ -279,15 +302,25 @@ def _diagnose_memory(directory: str) -> MemoryAdvisory:
         adv.tiers = st.get("tiers", {})
         adv.fts_tokenizer_mismatch = st.get("fts_tokenizer_mismatch", False)
 
+    # 5-6. Stats and consolidation dry-run, concurrently when both apply
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        stats_future = (
+            pool.submit(_memctl_json, directory, "stats")
+            if adv.db_exists or (st and not adv.doctor_available) else None
+        )
+        cons_future = (
+            pool.submit(_memctl_json, directory, "consolidate", "--dry-run") if adv.db_exists else None
+        )
+
     # 5. Stats (confirms FTS5 if doctor unavailable)
-    if adv.db_exists or (st and not adv.doctor_available):
-        stats = _memctl_stats(directory)
+    if stats_future is not None:
+        stats = stats_future.result()
         if stats and not adv.doctor_available:
             adv.fts5_available = stats.get("fts5_available", stats.get("fts5", False))
 
     # 6. Consolidation dry-run
-    if adv.db_exists:
-        cons = _memctl_consolidate_dry(directory)
+    if cons_future is not None:
+        cons = cons_future.result()
         if cons:
             adv.consolidation_clusters = cons.get("clusters", 0)
             adv.consolidation_merges = cons.get("merges", cons.get("potential_merges", 0))
@@ -322,47 +355,86 @@ def _diagnose_memory(directory: str) -> MemoryAdvisory:
     return adv
 
 
+# Seconds a persisted advisory stays valid (see _cached_diagnose_memory)
+_ADVISORY_TTL = 60.0
+
+
+def _advisory_stamp(directory: str, db_path: str) -> list | None:
+    """Return the inputs a cached advisory depends on, or None without memctl.
+
+    The memctl binary's mtime (upgrades) and the database's mtime/size.
+    """
+    memctl = shutil.which("memctl")
+    if memctl is None:
+        return None
+    stamp: list = [Path(memctl).stat().st_mtime_ns, None, None]
+    if db_path:
+        try:
+            st = (Path(directory) / db_path).stat()
+            stamp[1:] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            pass
+    return stamp
+
+
+def _cached_diagnose_memory(directory: str) -> MemoryAdvisory:
+    """Like :func:`_diagnose_memory`, reusing a recent result for *directory*.
+
+    The advisory is persisted per directory under the user cache dir and
+    reused for ``_ADVISORY_TTL`` seconds while the memctl binary and the
+    database are unchanged — back-to-back rescue runs skip all probes.
+    """
+    import hashlib
+
+    from toolbox._cache import CACHE_DIR
+
+    cache = CACHE_DIR / f"memadv-{hashlib.sha1(directory.encode()).hexdigest()}.json"
+    try:
+        if time.time() - cache.stat().st_mtime < _ADVISORY_TTL:
+            entry = loads(cache.read_bytes())
+            memory = entry["memory"]
+            if entry["stamp"] == _advisory_stamp(directory, memory["db_path"]):
+                return MemoryAdvisory(**memory)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # missing, expired or unreadable: probe afresh
+
+    adv = _diagnose_memory(directory)
+    if adv.memctl_ok:
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(cache, dumps({
+                "stamp": _advisory_stamp(directory, adv.db_path),
+                "memory": _advisory_to_dict(adv),
+            }))
+        except OSError:
+            pass  # cache is best-effort
+    return adv
+
+
 def _advisory_to_dict(adv: MemoryAdvisory) -> dict:
-    """Serialize a MemoryAdvisory to a JSON-safe dict."""
-    return {
-        "memctl_ok": adv.memctl_ok,
-        "memctl_version": adv.memctl_version,
-        "doctor_available": adv.doctor_available,
-        "doctor_status": adv.doctor_status,
-        "doctor_checks": adv.doctor_checks,
-        "db_path": adv.db_path,
-        "db_exists": adv.db_exists,
-        "eco_mode": adv.eco_mode,
-        "total_items": adv.total_items,
-        "tiers": adv.tiers,
-        "fts5_available": adv.fts5_available,
-        "fts_tokenizer_mismatch": adv.fts_tokenizer_mismatch,
-        "consolidation_clusters": adv.consolidation_clusters,
-        "consolidation_merges": adv.consolidation_merges,
-        "advice": adv.advice,
-    }
+    """Serialize a MemoryAdvisory to a JSON-safe dict (shallow: shares lists)."""
+    return {name: getattr(adv, name) for name in MemoryAdvisory.__slots__}
 
 
 def _print_memory_advisory(adv: MemoryAdvisory, *, quiet: bool = False) -> None:
-    """Print a formatted memory health advisory to stderr."""
+    """Print a formatted memory health advisory to stderr (in one write)."""
     if quiet:
         return
 
-    print(file=sys.stderr)
-    info(f"[Advisory] Memory health (non-destructive)\n")
+    out = ["", f"{_SIGIL_INFO} [Advisory] Memory health (non-destructive)", ""]
 
     if not adv.memctl_ok:
-        print(f"  {'memctl':<22s}  {_red('not found')}", file=sys.stderr)
+        out.append(f"  {'memctl':<22s}  {_red('not found')}")
         if adv.advice:
-            print(file=sys.stderr)
-            info("Recommended:")
-            for a in adv.advice:
-                print(f"    {a}", file=sys.stderr)
-        print(file=sys.stderr)
+            out.append("")
+            out.append(f"{_SIGIL_INFO} Recommended:")
+            out.extend(f"    {a}" for a in adv.advice)
+        out.append("")
+        sys.stderr.write("\n".join(out) + "\n")
         return
 
     # Version
-    print(f"  {'memctl':<22s}  {adv.memctl_version or 'unknown'}", file=sys.stderr)
+    out.append(f"  {'memctl':<22s}  {adv.memctl_version or 'unknown'}")
 
     # Doctor summary
     if adv.doctor_available and adv.doctor_checks:
@@ -380,18 +452,18 @@ def _print_memory_advisory(adv: MemoryAdvisory, *, quiet: bool = False) -> None:
             if fail_count:
                 parts.append(f"{fail_count} fail")
             doc_str = _yellow(", ".join(parts))
-        print(f"  {'doctor':<22s}  {doc_str}", file=sys.stderr)
+        out.append(f"  {'doctor':<22s}  {doc_str}")
     elif not adv.doctor_available:
-        print(f"  {'doctor':<22s}  {_yellow('not available (upgrade to 0.18.0+)')}", file=sys.stderr)
+        out.append(f"  {'doctor':<22s}  {_yellow('not available (upgrade to 0.18.0+)')}")
 
     # DB
-    print(f"  {'DB path':<22s}  {adv.db_path or 'n/a'}", file=sys.stderr)
-    db_val = _green("yes") if adv.db_exists else _red("no")
-    print(f"  {'DB exists':<22s}  {db_val}", file=sys.stderr)
+    out.append(f"  {'DB path':<22s}  {adv.db_path or 'n/a'}")
+    db_val = _YES_GREEN if adv.db_exists else _NO_RED
+    out.append(f"  {'DB exists':<22s}  {db_val}")
 
     # Eco
     eco_val = adv.eco_mode if adv.eco_mode else "unknown"
-    print(f"  {'Eco mode':<22s}  {eco_val}", file=sys.stderr)
+    out.append(f"  {'Eco mode':<22s}  {eco_val}")
 
     # Items
     if adv.db_exists:
@@ -399,16 +471,16 @@ def _print_memory_advisory(adv: MemoryAdvisory, *, quiet: bool = False) -> None:
         items_str = str(adv.total_items)
         if tier_parts:
             items_str += f" ({tier_parts})"
-        print(f"  {'Items':<22s}  {items_str}", file=sys.stderr)
+        out.append(f"  {'Items':<22s}  {items_str}")
 
     # FTS5
     fts_val = _green("available") if adv.fts5_available else _yellow("not available")
-    print(f"  {'FTS5':<22s}  {fts_val}", file=sys.stderr)
+    out.append(f"  {'FTS5':<22s}  {fts_val}")
 
     # Tokenizer match
     if adv.db_exists:
-        tok_val = _green("yes") if not adv.fts_tokenizer_mismatch else _yellow("mismatch")
-        print(f"  {'Tokenizer match':<22s}  {tok_val}", file=sys.stderr)
+        tok_val = _YES_GREEN if not adv.fts_tokenizer_mismatch else _yellow("mismatch")
+        out.append(f"  {'Tokenizer match':<22s}  {tok_val}")
 
     # Consolidation
     if adv.db_exists:
@@ -416,16 +488,16 @@ def _print_memory_advisory(adv: MemoryAdvisory, *, quiet: bool = False) -> None:
             cons_str = f"{adv.consolidation_clusters} clusters, {adv.consolidation_merges} potential merges"
         else:
             cons_str = _green("clean")
-        print(f"  {'Consolidation':<22s}  {cons_str}", file=sys.stderr)
+        out.append(f"  {'Consolidation':<22s}  {cons_str}")
 
     # Advice
     if adv.advice:
-        print(file=sys.stderr)
-        info("Recommended:")
-        for a in adv.advice:
-            print(f"    {a}", file=sys.stderr)
+        out.append("")
+        out.append(f"{_SIGIL_INFO} Recommended:")
+        out.extend(f"    {a}" for a in adv.advice)
 
-    print(file=sys.stderr)
+    out.append("")
+    sys.stderr.write("\n".join(out) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -444,6 +516,7 @@ class Situation:
     residual_tags: int = 0
     files_with_tags: list[str] = field(default_factory=list)
     backup_count: int = 0
+    backups_checked: bool = True
 
     @property
     def needs_recovery(self) -> bool:
@@ -465,6 +538,13 @@ class Situation:
 # Reporting
 # ---------------------------------------------------------------------------
 
+# Coloured yes/no cells, rendered once (the colour depends only on the value).
+_YES_GREEN = _green("yes")
+_YES_YELLOW = _yellow("yes")
+_NO_GREEN = _green("no")
+_NO_RED = _red("no")
+_NO_PLAIN = "no"
+
 _SEVERITY_LABEL = {
     "clean": _green("clean"),
     "stale": _yellow("stale session"),
@@ -474,32 +554,36 @@ _SEVERITY_LABEL = {
 
 
 def _print_report(sit: Situation, directory: str, *, quiet: bool = False) -> None:
-    """Print a formatted diagnostic table to stderr."""
+    """Print a formatted diagnostic table to stderr (in one write)."""
     if quiet:
         return
     rows = [
-        ("cloak on PATH", _green("yes") if sit.cloak_ok else _red("no")),
-        ("Session stale", _yellow("yes") if sit.session_stale else _green("no")),
-        ("Vault exists", _green("yes") if sit.vault_exists else "no"),
+        ("cloak on PATH", _YES_GREEN if sit.cloak_ok else _NO_RED),
+        ("Session stale", _YES_YELLOW if sit.session_stale else _NO_GREEN),
+        ("Vault exists", _YES_GREEN if sit.vault_exists else _NO_PLAIN),
         ("Vault entries", str(sit.vault_entries)),
         ("Residual TAG-xxxx", str(sit.residual_tags)),
-        ("Backups available", str(sit.backup_count)),
+        ("Backups available", str(sit.backup_count) if sit.backups_checked else "not checked"),
         ("Severity", _SEVERITY_LABEL.get(sit.severity, sit.severity)),
     ]
 
-    print(file=sys.stderr)
-    info(f"Rescue diagnostic — {_bold(directory)}\n")
-    for label, value in rows:
-        print(f"  {label:<20s}  {value}", file=sys.stderr)
+    out = ["", f"{_SIGIL_INFO} Rescue diagnostic — {_bold(directory)}", ""]
+    out.extend(f"  {label:<20s}  {value}" for label, value in rows)
 
     if sit.files_with_tags:
-        print(file=sys.stderr)
-        info("Files with residual tags:")
-        for f in sit.files_with_tags[:20]:
-            print(f"    {f}", file=sys.stderr)
+        out.append("")
+        out.append(f"{_SIGIL_INFO} Files with residual tags:")
+        out.extend(f"    {f}" for f in sit.files_with_tags[:20])
         if len(sit.files_with_tags) > 20:
-            print(f"    … and {len(sit.files_with_tags) - 20} more", file=sys.stderr)
-    print(file=sys.stderr)
+            out.append(f"    … and {len(sit.files_with_tags) - 20} more")
+    out.append("")
+    sys.stderr.write("\n".join(out) + "\n")
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601 (same form as ``datetime.isoformat``)."""
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs)) + f".{ns // 1000:06d}+00:00"
 
 
 # ---------------------------------------------------------------------------
@@ -517,18 +601,28 @@ def cmd_rescue(args) -> None:
     with_memory: bool = getattr(args, "with_memory", False) or memory_only
     json_mode: bool = getattr(args, "json", False)
 
+    # --memory-only --json: the dashboard/cron path — no Path resolution,
+    # no report rendering, one write of encoded JSON to stdout.
+    if memory_only and json_mode:
+        if directory == ".":
+            directory = os.getcwd()  # already absolute and symlink-free
+        elif os.path.isdir(directory):
+            directory = os.path.realpath(directory)
+        else:
+            die(f"Target directory does not exist: {os.path.abspath(directory)}")
+        adv = _cached_diagnose_memory(directory)
+        print_json({"memory": _advisory_to_dict(adv)})
+        sys.exit(2 if not adv.memctl_ok else (1 if adv.has_issues else 0))
+
     target = Path(directory).resolve()
     if not target.is_dir():
         die(f"Target directory does not exist: {target}")
-    directory = str(target)
+    directory = str(target)  # for subprocess argv and JSON; paths use target
 
     # --memory-only: skip cloak, run memory advisory only -------------------
     if memory_only:
-        adv = _diagnose_memory(directory)
-        if json_mode:
-            print(json.dumps({"memory": _advisory_to_dict(adv)}, indent=2))
-        else:
-            _print_memory_advisory(adv)
+        adv = _cached_diagnose_memory(directory)
+        _print_memory_advisory(adv)
         sys.exit(2 if not adv.memctl_ok else (1 if adv.has_issues else 0))
         return
 
@@ -539,23 +633,42 @@ def cmd_rescue(args) -> None:
     # Phase 2 — Diagnose -----------------------------------------------------
     sit = Situation(cloak_ok=True)
 
-    status = _cloak_status(directory)
+    # Independent read-only cloak probes: run them concurrently.  Backups
+    # only matter for --from-backup or when recovery turns out to be needed.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        status_future = pool.submit(_cloak_status, directory)
+        verify_future = pool.submit(_cloak_verify, directory)
+        backups_future = (
+            pool.submit(_list_backups, directory) if from_backup is not None else None
+        )
+
+    status = status_future.result()
     if status:
         sit.session_stale = status.get("session_active", False)
         sit.vault_exists = status.get("vault_exists", False)
         sit.vault_entries = status.get("vault_entries", 0)
     else:
         # Fallback: file-based checks
-        sit.session_stale = _has_stale_session(directory)
-        vault_path = target / ".cloak" / "vault"
-        sit.vault_exists = vault_path.is_dir() and any(vault_path.iterdir()) if vault_path.is_dir() else False
-        sit.vault_entries = len(list(vault_path.iterdir())) if sit.vault_exists else 0
-
-    tag_count, tag_files = _scan_tags(directory)
+        sit.session_stale = _has_stale_session(target)
+        try:
+            entries = os.listdir(target / ".cloak" / "vault")
+        except OSError:  # missing or not a directory
+            entries = []
+        sit.vault_exists = bool(entries)
+        sit.vault_entries = len(entries)
+
+    initial_verify = verify_future.result()
+    tag_count, tag_files = _scan_tags(directory, initial_verify)
     sit.residual_tags = tag_count
     sit.files_with_tags = tag_files
 
-    backups = _list_backups(directory)
+    if backups_future is not None:
+        backups = backups_future.result()
+    elif sit.needs_recovery:
+        backups = _list_backups(directory)
+    else:
+        backups = []  # clean project: not enumerated, reported as 0
+        sit.backups_checked = False
     sit.backup_count = len(backups)
 
     # Phase 3 — Report -------------------------------------------------------
@@ -582,7 +695,7 @@ def cmd_rescue(args) -> None:
         # Memory advisory (combined mode) even when cloak is clean
         mem_dict: dict | None = None
         if with_memory:
-            adv = _diagnose_memory(directory)
+            adv = _cached_diagnose_memory(directory)
             if json_mode:
                 mem_dict = _advisory_to_dict(adv)
             else:
@@ -606,7 +719,7 @@ def cmd_rescue(args) -> None:
             }
             if mem_dict is not None:
                 combined["memory"] = mem_dict
-            print(json.dumps(combined, indent=2))
+            print_json(combined)
         return
 
     # Phase 6 — Confirm (unless --force or --dry-run) ------------------------
@@ -668,46 +781,48 @@ def cmd_rescue(args) -> None:
 
     # Phase 8 — Verify -------------------------------------------------------
     verified = True
+    report = None
     if not dry_run:
-        verify_cmd = ["cloak", "verify", "--dir", directory]
-        result = run(verify_cmd, check=False, quiet=False)
+        if actions:
+            # Re-verify in a worker while the incident report is assembled
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                verify_future = pool.submit(_cloak_verify, directory, quiet=False)
+                report = {
+                    "timestamp": _now_iso(),
+                    "directory": directory,
+                    "situation": {
+                        "severity": sit.severity,
+                        "session_stale": sit.session_stale,
+                        "vault_exists": sit.vault_exists,
+                        "vault_entries": sit.vault_entries,
+                        "residual_tags": sit.residual_tags,
+                        "files_with_tags": sit.files_with_tags,
+                        "backup_count": sit.backup_count,
+                    },
+                    "actions": actions,
+                }
+                result = verify_future.result()
+        else:
+            result = initial_verify  # nothing ran since the diagnosis
         if result.returncode != 0:
             if not json_mode:
                 warn("Verification found remaining issues:")
-                if result.stdout:
-                    for line in result.stdout.strip().splitlines()[:10]:
-                        print(f"    {line}", file=sys.stderr)
+                for line in result.head:
+                    print(f"    {line}", file=sys.stderr)
             verified = False
             ok = False
 
     # Phase 8b — Incident report artifact ------------------------------------
-    if not dry_run and actions:
-        report = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "directory": directory,
-            "situation": {
-                "severity": sit.severity,
-                "session_stale": sit.session_stale,
-                "vault_exists": sit.vault_exists,
-                "vault_entries": sit.vault_entries,
-                "residual_tags": sit.residual_tags,
-                "files_with_tags": sit.files_with_tags,
-                "backup_count": sit.backup_count,
-            },
-            "actions": actions,
-            "verify": "pass" if verified else "fail",
-            "outcome": "recovered" if ok else "failed",
-        }
-        report_path = Path(directory) / ".cloak-rescue-report.json"
-        try:
-            report_path.write_text(
-                json.dumps(report, indent=2, ensure_ascii=False) + "\n",
-                encoding="utf-8",
-            )
-            if not json_mode:
-                info(f"Incident report written to {report_path}")
-        except OSError as exc:
-            warn(f"Could not write incident report: {exc}")
+    report_future = None
+    if report is not None:
+        report["verify"] = "pass" if verified else "fail"
+        report["outcome"] = "recovered" if ok else "failed"
+        report_path = target / ".cloak-rescue-report.json"
+        # Written in the background (slow disks, NFS), overlapping the
+        # summary and memory advisory; collected before output and exit
+        writer = ThreadPoolExecutor(max_workers=1)
+        report_future = writer.submit(atomic_write, report_path, dumps(report))
+        writer.shutdown(wait=False)
 
     # Phase 9 — Summary ------------------------------------------------------
     if not json_mode:
@@ -723,12 +838,20 @@ def cmd_rescue(args) -> None:
     # Memory advisory (combined mode) ----------------------------------------
     mem_dict = None
     if with_memory:
-        adv = _diagnose_memory(directory)
+        adv = _cached_diagnose_memory(directory)
         if json_mode:
             mem_dict = _advisory_to_dict(adv)
         else:
             _print_memory_advisory(adv)
 
+    if report_future is not None:
+        try:
+            report_future.result()
+            if not json_mode:
+                info(f"Incident report written to {report_path}")
+        except OSError as exc:
+            warn(f"Could not write incident report: {exc}")
+
     # JSON combined output ---------------------------------------------------
     if json_mode:
         combined = {
@@ -749,7 +872,7 @@ def cmd_rescue(args) -> None:
         }
         if mem_dict is not None:
             combined["memory"] = mem_dict
-        print(json.dumps(combined, indent=2))
+        print_json(combined)
 
     # Exit code contract: 0=clean, 1=dir missing, 2=cloak missing,
     # 3=remediation attempted but verification failed
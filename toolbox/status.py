@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import platform
 import shutil
 import sys
@@ -10,7 +11,7 @@ from pathlib import Path
 from toolbox import __version__
 from toolbox.config import CONFIG_FILENAME, find_config, load_config
 from toolbox.eco import _read_sentinel
-from toolbox.helpers import info, print_table, run
+from toolbox.helpers import info, print_table
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -19,25 +20,22 @@ from toolbox.helpers import info, print_table, run
 
 def _pkg_version(pip_name: str) -> str | None:
     """Return the installed version of a pip package, or None."""
-    result = run(
-        [sys.executable, "-m", "pip", "show", pip_name],
-        check=False,
-        quiet=True,
-    )
-    if result.returncode != 0:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(pip_name)
+    except PackageNotFoundError:
         return None
-    for line in result.stdout.splitlines():
-        if line.startswith("Version:"):
-            return line.split(":", 1)[1].strip()
-    return None
 
 
 def _check_commands(cwd: Path) -> list[str]:
     """Return list of installed slash commands in .claude/commands/."""
-    commands_dir = cwd / ".claude" / "commands"
-    if not commands_dir.is_dir():
+    try:
+        with os.scandir(cwd / ".claude" / "commands") as it:
+            # name[:-3] is the stem; a bare ".md" dotfile has no suffix
+            return sorted(e.name[:-3] for e in it if e.name.endswith(".md") and e.name != ".md")
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(f.stem for f in commands_dir.iterdir() if f.suffix == ".md")
 
 
 # ---------------------------------------------------------------------------
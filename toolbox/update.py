@@ -2,15 +2,18 @@
 
 Detects install method per tool, runs the appropriate upgrade command,
 and optionally re-runs project template updates.
+
+Heavier modules (doctor, the thread pool, urllib) are imported by the
+functions that need them, so scoped refreshes stay cheap to start.
 """
 
 from __future__ import annotations
 
-import json
 import sys
+import threading
 from pathlib import Path
 
-from toolbox.doctor import _cmd_version, _detect_install_method
+from toolbox._jsonio import loads, print_json
 from toolbox.helpers import error, info, run, warn
 
 # ---------------------------------------------------------------------------
@@ -29,29 +32,90 @@ _PACKAGES = [
 # ---------------------------------------------------------------------------
 
 
-def _pypi_latest(pip_name: str) -> str | None:
+_PYPI_JSON_URL = "https://pypi.org/pypi/{}/json"
+_PYPI_TTL = 3600.0  # seconds; override with TOOLBOXCTL_PYPI_TTL
+
+
+def _pypi_ttl() -> float:
+    """Return the PyPI cache TTL in seconds (``TOOLBOXCTL_PYPI_TTL`` overrides)."""
+    import os
+
+    try:
+        return float(os.environ.get("TOOLBOXCTL_PYPI_TTL", _PYPI_TTL))
+    except ValueError:
+        return _PYPI_TTL
+
+
+def _pypi_latest(pip_name: str, *, refresh: bool = False) -> str | None:
     """Query PyPI for the latest version of a package.
 
-    Uses ``pip index versions`` (pip 21.2+). Returns None if unavailable.
+    Reads the PyPI JSON API directly (no pip subprocess). Answers are
+    cached per package under the user cache dir for :func:`_pypi_ttl`
+    seconds; *refresh* bypasses the fresh-cache shortcut. Past that, the
+    request is conditional on the cached ETag / Last-Modified, so an
+    unchanged project costs a bodiless 304. Returns None if PyPI is
+    unreachable or the response is unexpected.
     """
-    result = run(
-        [sys.executable, "-m", "pip", "index", "versions", pip_name],
-        check=False,
-        quiet=True,
-    )
-    if result.returncode != 0:
+    import os
+    import time
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request, urlopen
+
+    from toolbox._jsonio import atomic_write, dumps
+    from toolbox._cache import CACHE_DIR
+
+    cache = CACHE_DIR / "pypi" / f"{pip_name}.json"
+    try:
+        cached = loads(cache.read_bytes())
+        if not refresh and time.time() - cache.stat().st_mtime < _pypi_ttl():
+            return cached["version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = {}  # missing or unreadable: unconditional request
+
+    request = Request(_PYPI_JSON_URL.format(pip_name))
+    if cached.get("version"):
+        if cached.get("etag"):
+            request.add_header("If-None-Match", cached["etag"])
+        if cached.get("last_modified"):
+            request.add_header("If-Modified-Since", cached["last_modified"])
+    try:
+        with urlopen(request, timeout=5) as resp:
+            latest = loads(resp.read())["info"]["version"]
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+    except HTTPError as exc:
+        if exc.code != 304:
+            return None
+        try:
+            os.utime(cache)  # revalidated: restart the TTL
+        except OSError:
+            pass
+        return cached["version"]
+    except (URLError, OSError, ValueError, KeyError, TypeError):
         return None
-    # Output format: "memctl (0.17.0)\n  Available versions: ..."
-    first_line = result.stdout.strip().splitlines()[0] if result.stdout else ""
-    if "(" in first_line and ")" in first_line:
-        return first_line.split("(")[1].split(")")[0].strip()
-    return None
+
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(cache, dumps({
+            "version": latest,
+            "etag": etag,
+            "last_modified": last_modified,
+        }))
+    except OSError:
+        pass  # cache is best-effort
+    return latest
 
 
 # ---------------------------------------------------------------------------
 # Upgrade logic
 # ---------------------------------------------------------------------------
 
+# Upgrades run concurrently (their version probes and PyPI checks overlap),
+# but the upgrade commands themselves are serialized: pip installs share the
+# running interpreter's site-packages, and every ``pipx upgrade`` also
+# upgrades pip in pipx's single shared-libraries venv.
+_INSTALL_LOCK = threading.Lock()
+
 
 def _upgrade_package(pkg: dict, *, quiet: bool = False) -> dict:
     """Upgrade a single package. Returns a result dict."""
@@ -59,8 +123,9 @@ def _upgrade_package(pkg: dict, *, quiet: bool = False) -> dict:
     cmd = pkg["cmd"]
     pip_name = pkg["pip_name"]
 
-    old_ver = _cmd_version(cmd)
-    method = _detect_install_method(cmd)
+    from toolbox.doctor import _cmd_version, _probe_tool
+
+    old_ver, method = _probe_tool(cmd)
 
     result = {
         "package": name,
@@ -77,8 +142,17 @@ def _upgrade_package(pkg: dict, *, quiet: bool = False) -> dict:
             warn(f"{name}: not installed, skipping.")
         return result
 
+    # Skip the pipx/pip run when PyPI has nothing newer (always asked
+    # afresh here: a stale cached answer would suppress a real upgrade)
+    if old_ver and old_ver == _pypi_latest(pip_name, refresh=True):
+        result["action"] = "already_latest"
+        return result
+
     if method == "pipx":
-        upgrade = run(["pipx", "upgrade", pip_name], check=False, quiet=quiet)
+        with _INSTALL_LOCK:
+            upgrade = run(
+                ["pipx", "upgrade", pip_name], capture="stderr", check=False, quiet=quiet,
+            )
         if upgrade.returncode != 0:
             result["action"] = "error"
             result["error"] = upgrade.stderr.strip() if upgrade.stderr else "upgrade failed"
@@ -87,11 +161,13 @@ def _upgrade_package(pkg: dict, *, quiet: bool = False) -> dict:
         else:
             result["action"] = "upgraded"
     elif method in ("pip/venv", "system"):
-        upgrade = run(
-            [sys.executable, "-m", "pip", "install", "--upgrade", pip_name],
-            check=False,
-            quiet=quiet,
-        )
+        with _INSTALL_LOCK:
+            upgrade = run(
+                [sys.executable, "-m", "pip", "install", "--upgrade", pip_name],
+                capture="stderr",
+                check=False,
+                quiet=quiet,
+            )
         if upgrade.returncode != 0:
             result["action"] = "error"
             result["error"] = upgrade.stderr.strip() if upgrade.stderr else "upgrade failed"
@@ -100,7 +176,7 @@ def _upgrade_package(pkg: dict, *, quiet: bool = False) -> dict:
         else:
             result["action"] = "upgraded"
 
-    # Re-check version after upgrade
+    # Re-check version after upgrade (deliberately not memoized)
     new_ver = _cmd_version(cmd)
     result["new_version"] = new_ver
 
@@ -112,34 +188,49 @@ def _upgrade_package(pkg: dict, *, quiet: bool = False) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def _check_packages(*, quiet: bool = False, as_json: bool = False) -> list[dict]:
-    """Show installed vs latest versions without upgrading."""
-    results = []
-    for pkg in _PACKAGES:
-        installed = _cmd_version(pkg["cmd"])
-        method = _detect_install_method(pkg["cmd"])
-        latest = _pypi_latest(pkg["pip_name"])
-
-        entry = {
-            "package": pkg["name"],
-            "installed": installed,
-            "latest": latest,
-            "method": method,
-            "up_to_date": (installed == latest) if (installed and latest) else None,
-        }
-        results.append(entry)
-
-        if not quiet and not as_json:
-            status = ""
-            if installed is None:
+# "up_to_date" of an installed package → status line (None: PyPI unknown)
+_CHECK_STATUS = {
+    True: "{installed} (up to date)",
+    False: "{installed} -> {latest} (update available)",
+    None: "{installed} (PyPI check unavailable)",
+}
+
+
+def _check_one(pkg: dict, refresh: bool = False) -> dict:
+    """Return installed vs latest version info for one package."""
+    from toolbox.doctor import _probe_tool
+
+    installed, method = _probe_tool(pkg["cmd"])
+    latest = _pypi_latest(pkg["pip_name"], refresh=refresh)
+    return {
+        "package": pkg["name"],
+        "installed": installed,
+        "latest": latest,
+        "method": method,
+        "up_to_date": (installed == latest) if (installed and latest) else None,
+    }
+
+
+def _check_packages(
+    *, quiet: bool = False, as_json: bool = False, refresh: bool = False
+) -> list[dict]:
+    """Show installed vs latest versions without upgrading.
+
+    *refresh* ignores cached PyPI answers (see :func:`_pypi_latest`).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Probes are subprocess/network-bound — run them concurrently
+    with ThreadPoolExecutor(max_workers=len(_PACKAGES)) as pool:
+        results = list(pool.map(lambda pkg: _check_one(pkg, refresh), _PACKAGES))
+
+    if not quiet and not as_json:
+        for entry in results:
+            if entry["installed"] is None:
                 status = "not installed"
-            elif latest is None:
-                status = f"{installed} (PyPI check unavailable)"
-            elif installed == latest:
-                status = f"{installed} (up to date)"
             else:
-                status = f"{installed} -> {latest} (update available)"
-            info(f"{pkg['name']}: {status} [{method}]")
+                status = _CHECK_STATUS[entry["up_to_date"]].format_map(entry)
+            info(f"{entry['package']}: {status} [{entry['method']}]")
 
     return results
 
@@ -178,20 +269,48 @@ def _refresh_global_block() -> None:
 
 def _read_json(path: Path) -> dict:
     """Read a JSON file, returning {} on error."""
-    if not path.exists():
-        return {}
     try:
-        with open(path, encoding="utf-8") as fh:
-            return json.load(fh)
-    except (json.JSONDecodeError, ValueError):
+        return loads(path.read_bytes())
+    except (OSError, ValueError):
         return {}
 
 
-def _refresh_project_templates(cwd: Path) -> None:
-    """Re-run project template updates if manifest exists."""
+def _refresh_stamp(cwd: Path, manifest_path: Path) -> str:
+    """Digest of what a template refresh reads and writes.
+
+    Covers the manifest, the project CLAUDE.md and the installed toolbox
+    version (read from disk metadata: an upgrade in this process counts).
+    """
+    import hashlib
+    from importlib.metadata import PackageNotFoundError, version
+
+    from toolbox import __version__
+
+    try:
+        toolbox_version = version("adservio-toolbox")
+    except PackageNotFoundError:
+        toolbox_version = __version__
+    h = hashlib.blake2b(toolbox_version.encode(), digest_size=16)
+    for path in (manifest_path, cwd / "CLAUDE.md"):
+        try:
+            h.update(path.read_bytes())
+        except FileNotFoundError:
+            pass
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _refresh_project_templates(cwd: Path, *, force: bool = False) -> None:
+    """Re-run project template updates if manifest exists.
+
+    Skipped when nothing changed since the last refresh (see
+    :func:`_refresh_stamp`; the digest is kept in ``.toolbox/state.json``)
+    unless *force* is set.
+    """
     from toolbox.project_wiring import (
         MANIFEST_FILE,
         TOOLBOX_DIR,
+        _state_session,
         install_project_claude_md,
         install_project_manifest,
     )
@@ -200,12 +319,18 @@ def _refresh_project_templates(cwd: Path) -> None:
     if not manifest_path.exists():
         return
 
-    manifest = _read_json(manifest_path)
-    profile = manifest.get("profile", "minimal")
+    with _state_session(cwd) as state:
+        if not force and state.get("refresh_stamp") == _refresh_stamp(cwd, manifest_path):
+            info("Project templates already up to date (use --refresh to force).")
+            return
+
+        manifest = _read_json(manifest_path)
+        profile = manifest.get("profile", "minimal")
 
-    info("Refreshing project templates ...")
-    install_project_claude_md(cwd, force=True, profile=profile)
-    install_project_manifest(cwd, profile=profile)
+        info("Refreshing project templates ...")
+        install_project_claude_md(cwd, force=True, profile=profile, state=state)
+        install_project_manifest(cwd, profile=profile)
+        state["refresh_stamp"] = _refresh_stamp(cwd, manifest_path)
 
 
 # ---------------------------------------------------------------------------
@@ -218,6 +343,7 @@ def cmd_update(args) -> None:
     check_only: bool = getattr(args, "check", False)
     quiet: bool = getattr(args, "quiet", False)
     as_json: bool = getattr(args, "json", False)
+    refresh: bool = getattr(args, "refresh", False)
     scope_global: bool = getattr(args, "scope_global", False)
     scope_project: bool = getattr(args, "scope_project", False)
 
@@ -226,25 +352,26 @@ def cmd_update(args) -> None:
         if scope_global:
             _refresh_global_block()
         if scope_project:
-            _refresh_project_templates(Path.cwd())
+            _refresh_project_templates(Path.cwd(), force=refresh)
         return
 
     if check_only:
-        results = _check_packages(quiet=quiet, as_json=as_json)
+        results = _check_packages(quiet=quiet, as_json=as_json, refresh=refresh)
         if as_json:
-            print(json.dumps(results, indent=2))
+            print_json(results)
         return
 
     if not quiet:
         info("Upgrading toolbox components ...")
 
-    results = []
-    for pkg in _PACKAGES:
-        result = _upgrade_package(pkg, quiet=quiet)
-        results.append(result)
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Upgrades run concurrently and quietly; outcomes are reported below
+    with ThreadPoolExecutor(max_workers=len(_PACKAGES)) as pool:
+        results = list(pool.map(lambda pkg: _upgrade_package(pkg, quiet=True), _PACKAGES))
 
     if as_json:
-        print(json.dumps(results, indent=2))
+        print_json(results)
         return
 
     if not quiet:
@@ -252,6 +379,10 @@ def cmd_update(args) -> None:
         print(file=sys.stderr)
         for r in results:
             if r["action"] == "not_installed":
+                warn(f"{r['package']}: not installed, skipping.")
+                continue
+            if r["action"] == "error":
+                error(f"{r['package']}: {r['method']} upgrade failed: {r['error']}")
                 continue
             old = r["old_version"] or "?"
             new = r["new_version"] or "?"
@@ -261,4 +392,4 @@ def cmd_update(args) -> None:
                 info(f"{r['package']}: {old} -> {new} [{r['method']}]")
 
     # Refresh project templates if in a toolbox-initialized project
-    _refresh_project_templates(Path.cwd())
+    _refresh_project_templates(Path.cwd(), force=refresh)